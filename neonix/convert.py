@@ -1,6 +1,8 @@
 from __future__ import print_function
 import os
 import sys
+import time
+import multiprocessing
 import neo
 from datetime import datetime
 from neonix.io.nixio import NixIO
@@ -18,84 +20,234 @@ def main():
         verbose = True
     else:
         verbose = False
-    for datafilename in [f for f in os.listdir(".") if os.path.isfile(f)]:
-        print("Processing {}".format(datafilename))
+    workers = int(get_option("-j", 1))
+    if workers < 1:
+        raise SystemExit("Option -j requires at least 1 worker.")
+    timeout = get_option("--timeout")
+    if timeout is not None:
+        timeout = float(timeout)
+    datafilenames = [f for f in os.listdir(".") if os.path.isfile(f)]
+    if workers > 1 or timeout is not None:
+        # a time limit needs a process per file that can be stopped
+        convert_parallel(datafilenames, workers, timeout, verbose)
+    else:
+        for datafilename in datafilenames:
+            convert_file(datafilename, verbose, report_message)
+
+
+def convert_parallel(datafilenames, workers, timeout=None, verbose=False):
+    """
+    Converts files in up to ``workers`` processes at a time, one process
+    per file. Messages from the workers are reported by the parent process
+    in the order of the files, so the error log is only written from one
+    process.
+
+    :param datafilenames: List of files to convert
+    :param workers: Number of worker processes
+    :param timeout: Seconds a file may take to convert, counted from when
+     its conversion starts. The process of a file that takes longer is
+     stopped and its slot is given to the next file.
+    :param verbose: Print the structure of the converted data
+    """
+    if workers < 1:
+        raise ValueError("At least 1 worker is required.")
+    pending = list(enumerate(datafilenames))
+    running = dict()
+    results = dict()
+    nextreport = 0
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                idx, datafilename = pending.pop(0)
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                proc = multiprocessing.Process(
+                    target=convert_worker,
+                    args=(sender, datafilename, verbose)
+                )
+                proc.start()
+                sender.close()
+                running[idx] = (proc, receiver, time.time(), datafilename)
+            for idx, (proc, receiver, start, datafilename) in \
+                    list(running.items()):
+                if receiver.poll():
+                    try:
+                        messages = receiver.recv()
+                    except EOFError:
+                        messages = [(True, "ERROR: conversion of file {} "
+                                           "ended without a result.".format(
+                                               datafilename))]
+                elif not proc.is_alive() and not receiver.poll():
+                    messages = [(True, "ERROR: conversion of file {} "
+                                       "stopped unexpectedly (exit code "
+                                       "{}).".format(datafilename,
+                                                     proc.exitcode))]
+                elif timeout is not None and time.time() - start > timeout:
+                    proc.terminate()
+                    messages = [(True, "ERROR: conversion of file {} timed "
+                                       "out after {} seconds.".format(
+                                           datafilename, timeout))]
+                else:
+                    continue
+                proc.join()
+                receiver.close()
+                del running[idx]
+                results[idx] = messages
+            while nextreport in results:
+                report(results.pop(nextreport))
+                nextreport += 1
+            if running:
+                time.sleep(0.05)
+    finally:
+        for proc, receiver, _, _ in running.values():
+            proc.terminate()
+            proc.join()
+
+
+def convert_worker(connection, datafilename, verbose=False):
+    """
+    Runs :func:`convert_file` in a worker process of
+    :func:`convert_parallel` and sends the messages back to the parent.
+
+    :param connection: The sending end of a Pipe to the parent
+    :param datafilename: The file to convert
+    :param verbose: Include the structure of the converted data
+    """
+    try:
+        messages = convert_file(datafilename, verbose)
+    except Exception as exc:
+        messages = [(True, "ERROR: The following unexpected error occurred "
+                           "during conversion of file {}.".format(
+                               datafilename)),
+                    (True, "       {}".format(exc))]
+    connection.send(messages)
+    connection.close()
+
+
+def convert_file(datafilename, verbose=False, emit=None):
+    """
+    Converts a single file to NIX. Without ``emit``, messages are collected
+    and returned instead of printed, so that the function can run in a
+    worker process.
+
+    :param datafilename: The file to convert
+    :param verbose: Include the structure of the converted data
+    :param emit: Function called with (is_error, message) for each message
+     as it happens. The messages are then not collected.
+    :return: List of (is_error, message) tuples
+    """
+    messages = list()
+    if emit is None:
+        def emit(iserror, message):
+            messages.append((iserror, message))
+
+    def out(message=""):
+        emit(False, message)
+
+    def err(message):
+        emit(True, message)
+
+    out("Processing {}".format(datafilename))
+    try:
+        reader = neo.io.get_io(datafilename)
+        out("File type: {}".format(reader.name))
+        data = reader.read()
+    except OSError:
+        err("NOTICE: file {} does not have an extension "
+            "known to Neo.".format(datafilename))
+        return messages
+    except ImportError as ie:
+        err("ERROR importing reader for file {}.".format(datafilename))
+        err("      {}".format(ie))
+        return messages
+    except Exception as exc:
+        err("ERROR reading file {}.".format(datafilename))
+        err("      {}".format(exc))
+        return messages
+    blocks = []
+    try:
+        blkiter = iter(data)
+    except TypeError:
+        blkiter = iter([data])
+    for item in blkiter:
+        if isinstance(item, neo.core.Block):
+            # filter out non-blocks
+            blocks.append(item)
+    if blocks:
+        if verbose:
+            print_neo(blocks, out)
+        nixfilename = datafilename.replace(".", "_")+"_nix.h5"
+        nixio = None
         try:
-            reader = neo.io.get_io(datafilename)
-            print("File type: {}".format(reader.name))
-            data = reader.read()
-        except OSError:
-            printerr("NOTICE: file {} does not have an extension "
-                     "known to Neo.".format(datafilename))
-            continue
-        except ImportError as ie:
-            printerr("ERROR importing reader for file {}.".format(datafilename))
-            printerr("      {}".format(ie))
-            continue
+            out("Writing data to {}".format(nixfilename))
+            nixio = NixIO(nixfilename, mode="ow")
+            nixio.write_all_blocks(blocks)
+            out("DONE: file {} converted and saved to {}".
+                format(datafilename, nixfilename))
+        except RuntimeError as re:
+            err("ERROR creating file {}".format(nixfilename))
+            err("      {}".format(re))
         except Exception as exc:
-            printerr("ERROR reading file {}.".format(datafilename))
-            printerr("      {}".format(exc))
-            continue
-        blocks = []
-        try:
-            blkiter = iter(data)
-        except TypeError:
-            blkiter = iter([data])
-        for item in blkiter:
-            if isinstance(item, neo.core.Block):
-                # filter out non-blocks
-                blocks.append(item)
-        if blocks:
-            if verbose:
-                print_neo(blocks)
-            nixfilename = datafilename.replace(".", "_")+"_nix.h5"
-            nixio = None
-            try:
-                print("Writing data to {}".format(nixfilename))
-                nixio = NixIO(nixfilename, mode="ow")
-                nixio.write_all_blocks(blocks)
-                print("DONE: file {} converted and saved to {}".
-                      format(datafilename, nixfilename))
-            except RuntimeError as re:
-                printerr("ERROR creating file {}".format(nixfilename))
-                printerr("      {}".format(re))
-            except Exception as exc:
-                printerr("ERROR: The following unexpected error occurred during"
-                         " conversion of file {}.".format(datafilename))
-                printerr("       {}".format(exc))
-            finally:
-                if nixio:
-                    del nixio
-        else:
-            print("File does not contain Blocks. Skipping.")
-        print()
-
-
-def print_neo(blocks):
+            err("ERROR: The following unexpected error occurred during"
+                " conversion of file {}.".format(datafilename))
+            err("       {}".format(exc))
+        finally:
+            if nixio:
+                del nixio
+    else:
+        out("File does not contain Blocks. Skipping.")
+    out()
+    return messages
+
+
+def print_neo(blocks, printfunc=print):
     for bidx, block in enumerate(blocks):
-        print("> ({}) Block: {}".format(bidx, block.name))
+        printfunc("> ({}) Block: {}".format(bidx, block.name))
         for sidx, segment in enumerate(block.segments):
-            print("     ├─> ({}) Segment: {}".format(sidx, segment.name))
+            printfunc("     ├─> ({}) Segment: {}".format(sidx, segment.name))
             for asidx, asig in enumerate(segment.analogsignals):
-                print("     │    ├─> ({}) AnalogSignal: {}".format(asidx,
-                                                                   asig.name))
+                printfunc("     │    ├─> ({}) AnalogSignal: {}".format(
+                    asidx, asig.name))
             for isidx, isig in enumerate(segment.irregularlysampledsignals):
-                print("     │    ├─> ({}) IrregularlySampledSignal: {}".
-                      format(isidx, isig.name))
+                printfunc("     │    ├─> ({}) IrregularlySampledSignal: {}".
+                          format(isidx, isig.name))
             for epidx, ep in enumerate(segment.epochs):
-                print("     │    ├─> ({}) Epoch: {}".format(epidx, ep.name))
+                printfunc("     │    ├─> ({}) Epoch: {}".format(
+                    epidx, ep.name))
             for evidx, ev in enumerate(segment.events):
-                print("     │    ├─> ({}) Event: {}".format(evidx, ev.name))
+                printfunc("     │    ├─> ({}) Event: {}".format(
+                    evidx, ev.name))
             for stidx, st in enumerate(segment.spiketrains):
-                print("     │    ├─> ({}) SpikeTrain: {}".format(stidx,
-                                                                 st.name))
+                printfunc("     │    ├─> ({}) SpikeTrain: {}".format(
+                    stidx, st.name))
         for ridx, rcg in enumerate(block.recordingchannelgroups):
-            print("     ├─> ({}) RCG: {}".format(ridx, rcg.name))
+            printfunc("     ├─> ({}) RCG: {}".format(ridx, rcg.name))
             for uidx, unit in enumerate(rcg.units):
-                print("     │    ├─> ({}) Unit: {}".format(uidx, unit.name))
+                printfunc("     │    ├─> ({}) Unit: {}".format(
+                    uidx, unit.name))
                 for stidx, st in enumerate(unit.spiketrains):
-                    print("     │    │    ├─> ({}*) SpikeTrain: {}".
-                          format(stidx, st.name))
+                    printfunc("     │    │    ├─> ({}*) SpikeTrain: {}".
+                              format(stidx, st.name))
+
+
+def report(messages):
+    for iserror, message in messages:
+        report_message(iserror, message)
+
+
+def report_message(iserror, message):
+    if iserror:
+        printerr(message)
+    else:
+        print(message)
+
+
+def get_option(name, default=None):
+    if name in sys.argv:
+        idx = sys.argv.index(name)
+        if idx + 1 < len(sys.argv):
+            return sys.argv[idx + 1]
+        raise SystemExit("Option {} requires a value.".format(name))
+    return default
 
 
 def printerr(message):
@@ -10,9 +10,14 @@
 from __future__ import absolute_import, print_function
 
 import os
+import copy
+import json
 import time
+import functools
+import multiprocessing
+from contextlib import contextmanager
 from datetime import datetime
-from collections import Iterable
+from collections import Iterable, Counter, OrderedDict, defaultdict
 import itertools
 from six import string_types
 from hashlib import md5
@@ -71,6 +76,28 @@ def calculate_timestamp(dt):
     return int(time.mktime(dt.timetuple()))
 
 
+def profiled(method):
+    """
+    Decorator for the public read and write methods of NixIO. If the IO has a
+    ``profile_callback``, the outermost decorated call collects an IOProfile
+    and passes it to the callback when it returns.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.profile_callback is None or self._profile.active:
+            return method(self, *args, **kwargs)
+        profile = IOProfile(method.__name__)
+        self._profile = profile
+        start = time.time()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            profile.seconds = time.time() - start
+            self._profile = _no_profile
+            self.profile_callback(profile)
+    return wrapper
+
+
 class NixIO(BaseIO):
     """
     Class for reading and writing NIX files.
@@ -89,6 +116,12 @@ class NixIO(BaseIO):
     extensions = ["h5"]
     mode = "file"
 
+    # name of the metadata property holding the content hash of an object
+    _hash_property = "neo.hash"
+    _manifest_section = "neo.manifest"
+    # maximum number of metadata Sections kept by _read_section_props
+    _section_cache_size = 4096
+
     _container_map = {
         "segments": "groups",
         "analogsignals": "data_arrays",
@@ -100,11 +133,59 @@ class NixIO(BaseIO):
         "units": "sources"
     }
 
-    def __init__(self, filename, mode="ro"):
+    def __init__(self, filename, mode="ro", signal_layout="split",
+                 track_changes=None, chunks=None, compression=None,
+                 compression_opts=None, shuffle=False,
+                 channel_layout="sources", mmap=False,
+                 waveform_write_size=None, load_waveforms=True,
+                 profile_callback=None, manifest=True):
         """
         Initialise IO instance and NIX file.
 
         :param filename: Full path to the file
+        :param mode: File access mode: 'ro' (ReadOnly), 'rw' (ReadWrite) or
+         'ow' (Overwrite)
+        :param signal_layout: How multichannel signals are written.
+         'split' stores one DataArray per channel, 'matrix' stores a single
+         two-dimensional (time x channel) DataArray per signal. Both layouts
+         are always readable.
+        :param track_changes: Hash objects as they are read so that a later
+         write only rewrites modified objects. Defaults to True, except in
+         'ro' mode where nothing can be written back.
+        :param chunks: Chunk shape of the signal, times, durations and
+         waveform DataArrays written by the IO. An integer sets the chunk
+         length along the first (time or spike) dimension, a tuple sets the
+         chunk lengths from the first dimension on (dimensions beyond the
+         rank of a DataArray are ignored, missing ones span the whole
+         array), True lets HDF5 guess and False stores the data
+         contiguously (not resizable; the arrays of signal streams are
+         chunked regardless). None uses the backend defaults.
+        :param compression: HDF5 compression filter for written DataArrays
+         (e.g., 'gzip' or 'lzf')
+        :param compression_opts: Options for the compression filter (e.g.,
+         gzip level 0-9)
+        :param shuffle: Enable the HDF5 shuffle filter
+        :param channel_layout: How the channels of a ChannelIndex are written.
+         'sources' creates a NIX Source with a metadata Section per channel,
+         'arrays' stores the indexes and coordinates as DataArrays linked to
+         the ChannelIndex Source and the channel names as a single metadata
+         property. Both layouts are always readable.
+        :param mmap: Return signal data as read-only memory-mapped views of
+         the file instead of copies, when the DataArray is stored contiguous
+         and uncompressed (see ``chunks=False``). Other DataArrays are read
+         normally. Only signals stored in the 'matrix' layout avoid a copy
+         completely; the channels of 'split' signals are still stacked.
+        :param waveform_write_size: Number of spikes written per call when
+         writing SpikeTrain waveforms. None writes all waveforms at once.
+        :param load_waveforms: Read the waveforms of SpikeTrains. If False,
+         SpikeTrains are read without waveforms unless requested explicitly
+         in :meth:`read_spiketrain`. Writing such a SpikeTrain back keeps
+         the waveforms stored in the file.
+        :param profile_callback: Function that is called with an IOProfile
+         of the counters and timings of each public read or write call. See
+         also :meth:`profile`.
+        :param manifest: Write a manifest of the objects of each Block when
+         it is written with :meth:`write_block`, for :meth:`list_objects`.
         """
         BaseIO.__init__(self, filename)
         self.filename = filename
@@ -118,18 +199,218 @@ class NixIO(BaseIO):
             raise ValueError("Invalid mode specified '{}'. "
                              "Valid modes: 'ro' (ReadOnly)', 'rw' (ReadWrite), "
                              "'ow' (Overwrite).".format(mode))
+        if signal_layout not in ("split", "matrix"):
+            raise ValueError("Invalid signal layout specified '{}'. "
+                             "Valid layouts: 'split', 'matrix'.".format(
+                                 signal_layout))
+        self.signal_layout = signal_layout
+        if channel_layout not in ("sources", "arrays"):
+            raise ValueError("Invalid channel layout specified '{}'. "
+                             "Valid layouts: 'sources', 'arrays'.".format(
+                                 channel_layout))
+        self.channel_layout = channel_layout
+        self._access_mode = mode
+        if track_changes is None:
+            track_changes = mode != "ro"
+        self.track_changes = track_changes
+        self._storage_options = dict()
+        if chunks is not None:
+            self._storage_options["chunks"] = chunks
+        if compression is not None:
+            self._storage_options["compression"] = compression
+            if compression_opts is not None:
+                self._storage_options["compression_opts"] = compression_opts
+        if shuffle:
+            self._storage_options["shuffle"] = True
+        self.mmap = mmap
+        self.waveform_write_size = waveform_write_size
+        self.load_waveforms = load_waveforms
+        self.profile_callback = profile_callback
+        self.manifest = manifest
+        self._profile = _no_profile
         self.nix_file = nixio.File.open(self.filename, filemode, backend="h5py")
         self._object_map = dict()
-        self._lazy_loaded = list()
+        self._path_map = dict()
+        self._referer_index = dict()
+        self._section_cache = OrderedDict()
+        self._lazy_loaded = dict()
         self._object_hashes = dict()
         self._block_read_counter = 0
+        self._manifest_invalid = set()
+        # name of the Block being written by write_block, which resolves
+        # the names and invalidates the manifest once for all its objects
+        self._writing_block = None
+
+    def session(self):
+        """
+        Returns a read-only session on the file of this IO, for serving
+        concurrent readers (e.g., one session per request or thread) without
+        reopening the file.
+
+        A session shares the open file and the lookup caches (paths, metadata
+        Sections and source references) with this IO. The caches are only
+        ever extended with entries that are the same for every reader, so
+        they can be filled from several threads. The state of a read (the
+        objects read, lazy objects and hashes) belongs to the session.
+        The file stays open as long as this IO; sessions must not close it.
+        Only available in 'ro' mode.
+
+        :return: A NixIO that shares the file with this IO
+        """
+        if self._access_mode != "ro":
+            raise ValueError("Sessions are only supported in 'ro' mode.")
+        return self._fork()
+
+    def _fork(self):
+        """
+        Returns a shallow copy of the IO that shares the file and the lookup
+        caches, with its own read state.
 
-    def read_all_blocks(self, cascade=True, lazy=False):
+        :return: A NixIO
+        """
+        fork = copy.copy(self)
+        fork._object_map = dict()
+        fork._lazy_loaded = dict()
+        fork._object_hashes = dict()
+        fork._block_read_counter = 0
+        fork._profile = _no_profile
+        return fork
+
+    @contextmanager
+    def profile(self):
+        """
+        Context manager that collects the counters and timings of all reads
+        and writes in its body into a single IOProfile::
+
+            with io.profile() as profile:
+                io.read_all_blocks()
+            print(profile.report())
+
+        :return: The IOProfile that is filled while the context is active
+        """
+        profile = IOProfile("profile")
+        outer = self._profile
+        self._profile = profile
+        start = time.time()
+        try:
+            yield profile
+        finally:
+            profile.seconds = time.time() - start
+            self._profile = outer
+
+    @profiled
+    def read_all_blocks(self, cascade=True, lazy=False, workers=None,
+                        timeout=None):
+        """
+        Reads all Blocks in the file.
+
+        :param cascade: Read the children of the Blocks (True, False or
+         'lazy')
+        :param lazy: Do not load data if True
+        :param workers: Number of processes that read Blocks in parallel.
+         Each worker opens the file read-only, reads whole Blocks and sends
+         them back pickled. Only available in 'ro' mode. Reads without a
+         full cascade or without data are cheap and always run in this
+         process. The Blocks are registered for change tracking and lazy
+         loading like serially read Blocks, but the NIX to Neo object map of
+         this IO is not filled, so later reads of single children (e.g.,
+         :meth:`read_channelindex`) create new objects.
+        :param timeout: Seconds to wait for a parallel read to finish. A
+         ``multiprocessing.TimeoutError`` is raised and the workers are
+         stopped when it is exceeded.
+        :return: List of Neo Blocks
+        """
+        paths = list("/" + blk.name for blk in self.nix_file.blocks)
+        if workers is not None and workers > 1:
+            if self._access_mode != "ro":
+                raise ValueError("Parallel reading is only supported in "
+                                 "'ro' mode.")
+            if cascade is True and not lazy and len(paths) > 1:
+                return self._read_blocks_parallel(paths, workers, timeout)
         blocks = list()
-        for blk in self.nix_file.blocks:
-            blocks.append(self.read_block("/" + blk.name, cascade, lazy))
+        for path in paths:
+            blocks.append(self.read_block(path, cascade, lazy))
         return blocks
 
+    def _read_blocks_parallel(self, paths, workers, timeout=None):
+        """
+        Reads the Blocks at the given paths in a pool of ``workers``
+        processes. The Blocks are returned in the order of the paths.
+        Errors of the workers are raised in this process. The workers are
+        terminated when the read ends, also after an error or a timeout.
+
+        :param paths: List of Block paths
+        :param workers: Number of worker processes
+        :param timeout: Seconds to wait for all Blocks, or None
+        :return: List of Neo Blocks
+        """
+        # the workers only read, so change tracking is done here after the
+        # Blocks arrive; memory-mapped views can't be sent between processes
+        options = dict(load_waveforms=self.load_waveforms,
+                       track_changes=False)
+        if timeout is not None:
+            deadline = time.time() + timeout
+        pool = multiprocessing.Pool(min(workers, len(paths)))
+        try:
+            results = list(pool.apply_async(_read_block_worker,
+                                            (self.filename, path, options))
+                           for path in paths)
+            pool.close()
+            blocks = list()
+            for result in results:
+                remaining = None
+                if timeout is not None:
+                    remaining = max(0, deadline - time.time())
+                try:
+                    blocks.append(result.get(remaining))
+                except multiprocessing.TimeoutError:
+                    raise multiprocessing.TimeoutError(
+                        "Reading {} of {} Blocks did not finish within {} "
+                        "seconds.".format(len(results) - len(blocks),
+                                          len(results), timeout)
+                    )
+        finally:
+            pool.terminate()
+            pool.join()
+        for block in blocks:
+            self._register_block(block)
+        return blocks
+
+    def _register_block(self, block):
+        """
+        Sets the ``path`` attribute of a Block and all of its children and
+        registers them like objects read by this IO (see
+        :meth:`_update_maps`). Signals, Epochs, Events and SpikeTrains lose
+        attributes that are not part of their pickled state, so the paths of
+        Blocks received from another process are rebuilt from the object
+        names.
+
+        :param block: A Neo Block read from this file
+        """
+        objects = list()
+        blockpath = "/" + block.name
+        block.path = blockpath
+        objects.append(block)
+        for seg in block.segments:
+            segpath = blockpath + "/segments/" + seg.name
+            seg.path = segpath
+            objects.append(seg)
+            for container in ("analogsignals", "irregularlysampledsignals",
+                              "epochs", "events", "spiketrains"):
+                for obj in getattr(seg, container):
+                    obj.path = segpath + "/" + container + "/" + obj.name
+                    objects.append(obj)
+        for chx in block.channel_indexes:
+            chxpath = blockpath + "/channel_indexes/" + chx.name
+            chx.path = chxpath
+            objects.append(chx)
+            for unit in chx.units:
+                unit.path = chxpath + "/units/" + unit.name
+                objects.append(unit)
+        for obj in objects:
+            self._update_maps(obj, False)
+
+    @profiled
     def read_block(self, path="/", cascade=True, lazy=False):
         if path == "/":
             try:
@@ -148,6 +429,7 @@ class NixIO(BaseIO):
         self._update_maps(neo_block, lazy)
         return neo_block
 
+    @profiled
     def read_segment(self, path, cascade=True, lazy=False):
         nix_group = self._get_object_at(path)
         neo_segment = self._group_to_neo(nix_group)
@@ -161,9 +443,11 @@ class NixIO(BaseIO):
             neo_segment.block = neo_parent
         return neo_segment
 
+    @profiled
     def read_channelindex(self, path, cascade=True, lazy=False):
         nix_source = self._get_object_at(path)
-        neo_rcg = self._source_chx_to_neo(nix_source)
+        nix_block = self._get_object_at("/" + path.split("/")[1])
+        neo_rcg = self._source_chx_to_neo(nix_source, nix_block)
         neo_rcg.path = path
         if cascade:
             self._read_cascade(nix_source, path, cascade, lazy)
@@ -173,58 +457,105 @@ class NixIO(BaseIO):
         neo_rcg.block = neo_parent
         return neo_rcg
 
-    def read_signal(self, path, lazy=False):
-        nix_data_arrays = list()
-        parent_group = self._get_parent(path)
-        parent_container = parent_group.data_arrays
-        signal_group_name = path.split("/")[-1]
-        for idx in itertools.count():
-            signal_name = "{}.{}".format(signal_group_name, idx)
-            if signal_name in parent_container:
-                nix_data_arrays.append(parent_container[signal_name])
-            else:
-                break
-        # check metadata segment
-        group_section = nix_data_arrays[0].metadata
-        for da in nix_data_arrays:
-            assert da.metadata == group_section,\
-                "DataArray {} is not a member of signal group {}".format(
-                    da.name, group_section.name
-                )
-        neo_signal = self._signal_da_to_neo(nix_data_arrays, lazy)
+    @profiled
+    def read_signal(self, path, lazy=False, t_start=None, t_stop=None,
+                    channel_indexes=None):
+        """
+        Reads the signal at the location specified by the path. If any of
+        ``t_start``, ``t_stop`` or ``channel_indexes`` are given, only the
+        requested part of the signal is read from the file. Such partial
+        signals have a ``partial_read`` attribute and can't be written back.
+
+        :param path: Location of the signal in the file
+        :param lazy: Do not load data if True
+        :param t_start: Start of the time window to read (inclusive). Plain
+         numbers are interpreted in the time units of the signal.
+        :param t_stop: End of the time window to read (exclusive)
+        :param channel_indexes: List of channel indexes to read
+        :return: The (partial) Neo signal
+        """
+        nix_data_arrays = self._get_object_at(path)
+        # all DataArrays of a signal share the same metadata section
+        metadata = nix_data_arrays[0].metadata
+        partial = not (t_start is None and t_stop is None and
+                       channel_indexes is None)
+        if t_start is None and t_stop is None:
+            index = None
+        else:
+            index = self._get_sample_slice(nix_data_arrays[0], t_start, t_stop,
+                                           metadata)
+        neo_signal = self._signal_da_to_neo(nix_data_arrays, lazy,
+                                            index, channel_indexes, metadata)
         neo_signal.path = path
         if self._find_lazy_loaded(neo_signal) is None:
-            self._update_maps(neo_signal, lazy)
+            if not partial:
+                self._update_maps(neo_signal, lazy)
             nix_parent = self._get_parent(path)
             neo_parent = self._get_mapped_object(nix_parent)
             neo_signal.segment = neo_parent
         return neo_signal
 
-    def read_analogsignal(self, path, cascade=True, lazy=False):
-        return self.read_signal(path, lazy)
+    @profiled
+    def read_analogsignal(self, path, cascade=True, lazy=False,
+                          t_start=None, t_stop=None, channel_indexes=None):
+        return self.read_signal(path, lazy, t_start, t_stop, channel_indexes)
+
+    @profiled
+    def read_irregularlysampledsignal(self, path, cascade=True, lazy=False,
+                                      t_start=None, t_stop=None,
+                                      channel_indexes=None):
+        return self.read_signal(path, lazy, t_start, t_stop, channel_indexes)
 
-    def read_irregularlysampledsignal(self, path, cascade=True, lazy=False):
-        return self.read_signal(path, lazy)
+    @profiled
+    def read_eest(self, path, lazy=False, t_start=None, t_stop=None,
+                  load_waveforms=None):
+        """
+        Reads the Epoch, Event or SpikeTrain at the location specified by the
+        path. If ``t_start`` or ``t_stop`` are given, only the elements in the
+        time window are read. The times are assumed to be sorted. Such
+        partial objects have a ``partial_read`` attribute and can't be
+        written back.
 
-    def read_eest(self, path, lazy=False):
+        :param path: Location of the object in the file
+        :param lazy: Do not load data if True
+        :param t_start: Start of the time window to read (inclusive). Plain
+         numbers are interpreted in the time units of the object.
+        :param t_stop: End of the time window to read (exclusive)
+        :param load_waveforms: Read the waveforms of a SpikeTrain. None uses
+         the ``load_waveforms`` setting of the IO.
+        :return: The (partial) Neo object
+        """
         nix_mtag = self._get_object_at(path)
-        neo_eest = self._mtag_eest_to_neo(nix_mtag, lazy)
+        if load_waveforms is None:
+            load_waveforms = self.load_waveforms
+        if t_start is None and t_stop is None:
+            index = slice(None)
+        else:
+            index = self._get_position_slice(nix_mtag, t_start, t_stop)
+        neo_eest = self._mtag_eest_to_neo(nix_mtag, lazy, index,
+                                          load_waveforms)
         neo_eest.path = path
-        self._update_maps(neo_eest, lazy)
+        if self._is_mapped_eest_read(nix_mtag, lazy, index, load_waveforms):
+            self._update_maps(neo_eest, lazy)
         nix_parent = self._get_parent(path)
         neo_parent = self._get_mapped_object(nix_parent)
         neo_eest.segment = neo_parent
         return neo_eest
 
+    @profiled
     def read_epoch(self, path, cascade=True, lazy=False):
         return self.read_eest(path, lazy)
 
+    @profiled
     def read_event(self, path, cascade=True, lazy=False):
         return self.read_eest(path, lazy)
 
-    def read_spiketrain(self, path, cascade=True, lazy=False):
-        return self.read_eest(path, lazy)
+    @profiled
+    def read_spiketrain(self, path, cascade=True, lazy=False,
+                        t_start=None, t_stop=None, load_waveforms=None):
+        return self.read_eest(path, lazy, t_start, t_stop, load_waveforms)
 
+    @profiled
     def read_unit(self, path, cascade=True, lazy=False):
         nix_source = self._get_object_at(path)
         neo_unit = self._source_unit_to_neo(nix_source)
@@ -249,18 +580,33 @@ class NixIO(BaseIO):
         self._object_map[nix_group.id] = neo_segment
         return neo_segment
 
-    def _source_chx_to_neo(self, nix_source):
+    def _source_chx_to_neo(self, nix_source, nix_block=None):
         neo_attrs = self._nix_attr_to_neo(nix_source)
-        chx = list(self._nix_attr_to_neo(c)
-                   for c in nix_source.sources
-                   if c.type == "neo.channelindex")
-        neo_attrs["channel_names"] = np.array([c["name"] for c in chx],
-                                              dtype="S")
-        neo_attrs["index"] = np.array([c["index"] for c in chx])
-        if "coordinates" in chx[0]:
-            coord_units = chx[0]["coordinates.units"]
-            coord_values = list(c["coordinates"] for c in chx)
-            neo_attrs["coordinates"] = pq.Quantity(coord_values, coord_units)
+        indexname = nix_source.name + ".index"
+        if nix_block is not None and indexname in nix_block.data_arrays:
+            # channels stored as DataArrays ('arrays' channel layout)
+            neo_attrs["index"] = nix_block.data_arrays[indexname][:]
+            channel_names = neo_attrs.pop("channel_names", [])
+            if isinstance(channel_names, string_types):
+                channel_names = [channel_names]
+            neo_attrs["channel_names"] = np.array(channel_names, dtype="S")
+            coordname = nix_source.name + ".coordinates"
+            if coordname in nix_block.data_arrays:
+                coordda = nix_block.data_arrays[coordname]
+                neo_attrs["coordinates"] = pq.Quantity(coordda[:],
+                                                       coordda.unit)
+        else:
+            chx = list(self._nix_attr_to_neo(c)
+                       for c in nix_source.sources
+                       if c.type == "neo.channelindex")
+            neo_attrs["channel_names"] = np.array([c["name"] for c in chx],
+                                                  dtype="S")
+            neo_attrs["index"] = np.array([c["index"] for c in chx])
+            if "coordinates" in chx[0]:
+                coord_units = chx[0]["coordinates.units"]
+                coord_values = list(c["coordinates"] for c in chx)
+                neo_attrs["coordinates"] = pq.Quantity(coord_values,
+                                                       coord_units)
         rcg = ChannelIndex(**neo_attrs)
         self._object_map[nix_source.id] = rcg
         return rcg
@@ -271,7 +617,8 @@ class NixIO(BaseIO):
         self._object_map[nix_unit.id] = neo_unit
         return neo_unit
 
-    def _signal_da_to_neo(self, nix_da_group, lazy):
+    def _signal_da_to_neo(self, nix_da_group, lazy, index=None,
+                          channel_indexes=None, metadata=None, register=True):
         """
         Convert a group of NIX DataArrays to a Neo signal. This method expects
         a list of data arrays that all represent the same, multidimensional
@@ -279,20 +626,58 @@ class NixIO(BaseIO):
         This returns either an AnalogSignal or IrregularlySampledSignal.
 
         :param nix_da_group: a list of NIX DataArray objects
+        :param index: slice of samples (first dimension) to read
+        :param channel_indexes: list of channels to read
+        :param metadata: the metadata Section shared by the DataArrays, if
+         already resolved
+        :param register: Map the DataArrays to the signal for cascades.
+         False for reads that must not replace the signal read by the IO
+         (e.g., by proxies).
         :return: a Neo Signal object
         """
-        nix_da_group = sorted(nix_da_group, key=lambda d: d.name)
-        neo_attrs = self._nix_attr_to_neo(nix_da_group[0])
-        metadata = nix_da_group[0].metadata
+        nix_da_group = sorted(nix_da_group,
+                              key=lambda d: int(d.name.split(".")[-1]))
+        if metadata is None:
+            metadata = nix_da_group[0].metadata
+        neo_attrs = self._nix_attr_to_neo(nix_da_group[0], metadata)
         neo_attrs["name"] = stringify(metadata.name)
         neo_type = nix_da_group[0].type
 
         unit = nix_da_group[0].unit
+        matrix = self._is_matrix_signal(nix_da_group)
+        data_arrays = nix_da_group
+        if channel_indexes is not None and not matrix:
+            data_arrays = list(nix_da_group[idx] for idx in channel_indexes)
+        if index is None:
+            index = slice(None)
         if lazy:
             signaldata = pq.Quantity(np.empty(0), unit)
-            lazy_shape = (len(nix_da_group[0]), len(nix_da_group))
+            if matrix:
+                nsamples, nchannels = nix_da_group[0].data_extent
+                if channel_indexes is not None:
+                    nchannels = len(channel_indexes)
+            else:
+                nsamples = len(nix_da_group[0])
+                nchannels = len(data_arrays)
+            lazy_shape = (len(range(*index.indices(nsamples))), nchannels)
         else:
-            signaldata = pq.Quantity(np.transpose(nix_da_group), unit)
+            if matrix and channel_indexes is None:
+                data = self._read_data(nix_da_group[0], index)
+            elif matrix:
+                # only the requested columns are read; h5py selects them
+                # sorted and without repeats, so the order is restored here
+                nchannels = nix_da_group[0].data_extent[1]
+                channels, order = np.unique(
+                    np.arange(nchannels)[channel_indexes], return_inverse=True
+                )
+                data = self._read_data(nix_da_group[0],
+                                       (index, channels.tolist()))
+                data = data[:, order]
+            else:
+                data = np.transpose(list(self._read_data(da, index)
+                                         for da in data_arrays))
+            # data is freshly read (or a read-only view of the file)
+            signaldata = pq.Quantity(data, unit, copy=False)
             lazy_shape = None
         timedim = self._get_time_dimension(nix_da_group[0])
         if (neo_type == "neo.analogsignal" or
@@ -301,57 +686,228 @@ class NixIO(BaseIO):
                 sampling_period = pq.Quantity(1, timedim.unit)
                 t_start = pq.Quantity(0, timedim.unit)
             else:
-                if "sampling_interval.units" in metadata.props:
-                    sample_units = metadata["sampling_interval.units"]
-                else:
-                    sample_units = timedim.unit
-                sampling_period = pq.Quantity(timedim.sampling_interval,
-                                              sample_units)
-                if "t_start.units" in metadata.props:
-                    tsunits = metadata["t_start.units"]
-                else:
-                    tsunits = timedim.unit
-                t_start = pq.Quantity(timedim.offset, tsunits)
+                sampling_period, t_start = self._get_sampling(timedim,
+                                                              metadata)
+                if index.start:
+                    t_start = (t_start +
+                               index.start * sampling_period).rescale(
+                                   t_start.units)
             neo_signal = AnalogSignal(
                 signal=signaldata, sampling_period=sampling_period,
-                t_start=t_start, **neo_attrs
+                t_start=t_start, copy=False, **neo_attrs
             )
         elif neo_type == "neo.irregularlysampledsignal"\
                 or isinstance(timedim, nixtypes["RangeDimension"]):
             if lazy:
                 times = pq.Quantity(np.empty(0), timedim.unit)
             else:
-                times = pq.Quantity(timedim.ticks, timedim.unit)
+                times = pq.Quantity(np.asarray(timedim.ticks)[index],
+                                    timedim.unit)
             neo_signal = IrregularlySampledSignal(
-                signal=signaldata, times=times, **neo_attrs
+                signal=signaldata, times=times, copy=False, **neo_attrs
             )
         else:
             return None
-        for da in nix_da_group:
-            self._object_map[da.id] = neo_signal
+        if matrix:
+            nsamples = nix_da_group[0].data_extent[0]
+        else:
+            nsamples = len(nix_da_group[0])
+        if not (self._is_full_slice(index, nsamples) and
+                channel_indexes is None):
+            # parts of a signal are not used as the signal in cascades and
+            # must not be written back over the full signal
+            neo_signal.partial_read = True
+        elif register:
+            for da in nix_da_group:
+                self._object_map[da.id] = neo_signal
         if lazy_shape:
             neo_signal.lazy_shape = lazy_shape
         return neo_signal
 
-    def _mtag_eest_to_neo(self, nix_mtag, lazy):
+    @staticmethod
+    def _is_full_slice(index, length):
+        """
+        Checks whether a slice selects all elements of a sequence.
+
+        :param index: A slice object
+        :param length: Length of the sequence
+        :return: True if all elements are selected in order
+        """
+        return index.indices(length) == (0, length, 1)
+
+    def _read_data(self, nix_da, index=slice(None)):
+        """
+        Reads the data of a DataArray, or the part selected by ``index``.
+        In mmap mode, a memory-mapped view is returned when the DataArray
+        supports it.
+
+        :param nix_da: A NIX DataArray
+        :param index: Index or slice into the data
+        :return: A numpy array
+        """
+        if self.mmap:
+            view = self._memmap(nix_da)
+            if view is not None:
+                self._profile.count("mmap_reads")
+                return view[index]
+        return self._read_array(nix_da, index)
+
+    def _read_array(self, nix_da, index=slice(None)):
+        """
+        Reads the data of a DataArray, or the part selected by ``index``,
+        into memory.
+
+        :param nix_da: A NIX DataArray
+        :param index: Index or slice into the data
+        :return: A numpy array
+        """
+        profile = self._profile
+        with profile.timer("dataset_read"):
+            data = nix_da[index]
+        profile.count("dataset_reads")
+        profile.count("bytes_read", np.asarray(data).nbytes)
+        return data
+
+    def _memmap(self, nix_da):
+        """
+        Returns a read-only memory-mapped view of the data of a DataArray, or
+        None if the data is chunked, compressed or not yet allocated.
+
+        :param nix_da: A NIX DataArray
+        :return: A numpy memmap or None
+        """
+        dset = self._get_h5dataset(nix_da)
+        if dset.chunks is not None or dset.dtype.hasobject:
+            return None
+        offset = dset.id.get_offset()
+        if offset is None:
+            return None
+        return np.memmap(self.filename, mode="r", dtype=dset.dtype,
+                         shape=dset.shape, offset=offset)
+
+    def _get_sampling(self, timedim, metadata):
+        """
+        Returns the sampling period and start time of a regularly sampled
+        signal as Quantities, using the units stored in the signal metadata
+        when available.
+
+        :param timedim: The SampledDimension of the signal
+        :param metadata: The metadata Section of the signal
+        :return: Tuple of (sampling_period, t_start)
+        """
+        props = self._read_section_props(metadata)
+        sample_units = props.get("sampling_interval.units", timedim.unit)
+        sampling_period = pq.Quantity(timedim.sampling_interval, sample_units)
+        tsunits = props.get("t_start.units", timedim.unit)
+        t_start = pq.Quantity(timedim.offset, tsunits)
+        return sampling_period, t_start
+
+    def _get_sample_slice(self, nix_da, t_start, t_stop, metadata=None):
+        """
+        Converts a time window to a slice of sample indices along the time
+        dimension of a signal DataArray. Only the dimension descriptors are
+        read; the signal data is not touched.
+        The window includes samples at times ``t_start <= t < t_stop``.
+
+        :param nix_da: A DataArray of the signal
+        :param t_start: Start of the window or None
+        :param t_stop: End of the window or None
+        :param metadata: The metadata Section of the signal, if already
+         resolved
+        :return: A slice object
+        """
+        timedim = self._get_time_dimension(nix_da)
+        if isinstance(timedim, nixtypes["SampledDimension"]):
+            if metadata is None:
+                metadata = nix_da.metadata
+            sampling_period, sig_t_start = self._get_sampling(timedim,
+                                                              metadata)
+
+            def toindex(t):
+                if not isinstance(t, pq.Quantity):
+                    t = pq.Quantity(t, sig_t_start.units)
+                nsamples = ((t - sig_t_start) /
+                            sampling_period).simplified.magnitude
+                return max(0, int(np.ceil(np.round(nsamples, 10))))
+        else:
+            ticks = np.asarray(timedim.ticks)
+
+            def toindex(t):
+                if isinstance(t, pq.Quantity):
+                    t = t.rescale(timedim.unit).magnitude
+                return int(np.searchsorted(ticks, t, side="left"))
+
+        start = None if t_start is None else toindex(t_start)
+        stop = None if t_stop is None else toindex(t_stop)
+        return slice(start, stop)
+
+    @staticmethod
+    def _get_position_slice(nix_mtag, t_start, t_stop):
+        """
+        Converts a time window to a slice of the positions of a MultiTag.
+        The window includes positions ``t_start <= t < t_stop``. Only the
+        positions are read; extents and features are not touched.
+
+        :param nix_mtag: A NIX MultiTag with sorted positions
+        :param t_start: Start of the window or None
+        :param t_stop: End of the window or None
+        :return: A slice object
+        """
+        positions = nix_mtag.positions
+        times = positions[:]
+
+        def toindex(t):
+            if isinstance(t, pq.Quantity):
+                t = t.rescale(positions.unit).magnitude
+            return int(np.searchsorted(times, t, side="left"))
+
+        start = None if t_start is None else toindex(t_start)
+        stop = None if t_stop is None else toindex(t_stop)
+        return slice(start, stop)
+
+    def _mtag_eest_to_neo(self, nix_mtag, lazy, index=None,
+                          load_waveforms=None, register=True):
+        """
+        Convert a NIX MultiTag to a Neo Epoch, Event or SpikeTrain.
+
+        :param nix_mtag: a NIX MultiTag
+        :param lazy: Do not load data if True
+        :param index: slice of the positions (and of durations, labels and
+         waveforms) to read
+        :param load_waveforms: Read the waveforms of a SpikeTrain. None uses
+         the ``load_waveforms`` setting of the IO.
+        :param register: Map the MultiTag to the object for cascades. False
+         for reads that must not replace the object read by the IO (e.g.,
+         by proxies).
+        :return: a Neo Epoch, Event or SpikeTrain
+        """
         neo_attrs = self._nix_attr_to_neo(nix_mtag)
         neo_type = nix_mtag.type
+        if index is None:
+            index = slice(None)
+        if load_waveforms is None:
+            load_waveforms = self.load_waveforms
 
         time_unit = nix_mtag.positions.unit
         if lazy:
             times = pq.Quantity(np.empty(0), time_unit)
-            lazy_shape = np.shape(nix_mtag.positions)
+            lazy_shape = (len(range(*index.indices(
+                len(nix_mtag.positions)))),)
         else:
-            times = pq.Quantity(nix_mtag.positions, time_unit)
+            times = pq.Quantity(self._read_array(nix_mtag.positions, index),
+                                time_unit)
             lazy_shape = None
         if neo_type == "neo.epoch":
             if lazy:
                 durations = pq.Quantity(np.empty(0), nix_mtag.extents.unit)
                 labels = np.empty(0, dtype='S')
             else:
-                durations = pq.Quantity(nix_mtag.extents, nix_mtag.extents.unit)
+                durations = pq.Quantity(
+                    self._read_array(nix_mtag.extents, index),
+                    nix_mtag.extents.unit
+                )
                 labels = np.array(nix_mtag.positions.dimensions[0].labels,
-                                  dtype="S")
+                                  dtype="S")[index]
             eest = Epoch(times=times, durations=durations, labels=labels,
                          **neo_attrs)
         elif neo_type == "neo.event":
@@ -359,7 +915,7 @@ class NixIO(BaseIO):
                 labels = np.empty(0, dtype='S')
             else:
                 labels = np.array(nix_mtag.positions.dimensions[0].labels,
-                                  dtype="S")
+                                  dtype="S")[index]
             eest = Event(times=times, labels=labels, **neo_attrs)
         elif neo_type == "neo.spiketrain":
             if "t_start" in neo_attrs:
@@ -402,7 +958,10 @@ class NixIO(BaseIO):
                     eest.sampling_period = pq.Quantity(1, wftime.unit)
                     eest.left_sweep = pq.Quantity(0, wftime.unit)
                 else:
-                    eest.waveforms = pq.Quantity(wfda, wfda.unit)
+                    if load_waveforms:
+                        eest.waveforms = pq.Quantity(
+                            self._read_array(wfda, index), wfda.unit
+                        )
                     if interval_units is None:
                         interval_units = wftime.unit
                     eest.sampling_period = pq.Quantity(
@@ -416,11 +975,34 @@ class NixIO(BaseIO):
                         )
         else:
             return None
-        self._object_map[nix_mtag.id] = eest
+        if not self._is_full_slice(index, len(nix_mtag.positions)):
+            eest.partial_read = True
+        elif register and self._is_mapped_eest_read(nix_mtag, lazy, index,
+                                                    load_waveforms):
+            self._object_map[nix_mtag.id] = eest
         if lazy_shape:
             eest.lazy_shape = lazy_shape
         return eest
 
+    def _is_mapped_eest_read(self, nix_mtag, lazy, index, load_waveforms):
+        """
+        Checks whether an Epoch, Event or SpikeTrain read from ``nix_mtag``
+        is the object the IO reads in cascades: all positions, and the
+        waveforms only if the IO loads them (lazy reads load neither). Only
+        such reads are registered for cascades, lazy loading and change
+        tracking; others are side reads of the stored object.
+
+        :param nix_mtag: The NIX MultiTag
+        :param lazy: The read does not load data
+        :param index: slice of the positions that are read
+        :param load_waveforms: The read loads the waveforms of a SpikeTrain
+        :return: True if the read object stands for the stored object
+        """
+        if not self._is_full_slice(index, len(nix_mtag.positions)):
+            return False
+        return (lazy or load_waveforms == self.load_waveforms or
+                not len(nix_mtag.features))
+
     def _read_cascade(self, nix_obj, path, cascade, lazy):
         neo_obj = self._object_map[nix_obj.id]
         for neocontainer in getattr(neo_obj, "_child_containers", []):
@@ -449,7 +1031,10 @@ class NixIO(BaseIO):
             # set references to signals
             parent_block_path = "/" + path.split("/")[1]
             parent_block = self._get_object_at(parent_block_path)
-            ref_das = self._get_referers(nix_obj, parent_block.data_arrays)
+            ref_das = self._get_referers(nix_obj, parent_block, "data_arrays")
+            ref_das = list(da for da in ref_das
+                           if da.type in ("neo.analogsignal",
+                                          "neo.irregularlysampledsignal"))
             ref_signals = self._get_mapped_objects(ref_das)
             # deduplicate by name
             ref_signals = list(dict((s.name, s) for s in ref_signals).values())
@@ -464,7 +1049,7 @@ class NixIO(BaseIO):
             # set references to spiketrains
             parent_block_path = "/" + path.split("/")[1]
             parent_block = self._get_object_at(parent_block_path)
-            ref_mtags = self._get_referers(nix_obj, parent_block.multi_tags)
+            ref_mtags = self._get_referers(nix_obj, parent_block, "multi_tags")
             ref_sts = self._get_mapped_objects(ref_mtags)
             for st in ref_sts:
                 neo_obj.spiketrains.append(st)
@@ -481,9 +1066,296 @@ class NixIO(BaseIO):
         read_func = getattr(self, "read_" + neotype)
         return read_func(path, cascade, lazy)
 
+    def get_proxy(self, path):
+        """
+        Returns a proxy for the signal or SpikeTrain at the location specified
+        by the path. The proxy keeps the NIX object and only reads data when
+        it is indexed or loaded.
+
+        :param path: Location of the signal or SpikeTrain in the file
+        :return: An AnalogSignalProxy or SpikeTrainProxy
+        """
+        container = path.split("/")[-2]
+        if container in ("analogsignals", "irregularlysampledsignals"):
+            nix_data_arrays = self._get_object_at(path)
+            if not nix_data_arrays:
+                raise KeyError("No signal found at {}".format(path))
+            return AnalogSignalProxy(self, path, nix_data_arrays)
+        elif container == "spiketrains":
+            return SpikeTrainProxy(self, path, self._get_object_at(path))
+        raise ValueError("Proxies are only supported for signals and "
+                         "SpikeTrains, not for {}.".format(path))
+
+    def list_objects(self, objtype=None, **criteria):
+        """
+        Lists the objects in the file without reading them, using the
+        manifests written with the Blocks. Blocks without a manifest (e.g.,
+        written by older versions, or changed by writing single objects or
+        streaming signals) are read lazily instead.
+
+        Each object is described by a dictionary with the keys 'path', 'type'
+        (e.g., 'spiketrain'), 'name' and 'parent' (path). Data objects also
+        have 'shape', 'units', 't_start' and 't_stop' (in seconds);
+        AnalogSignals have 'sampling_rate' (in Hz), signals 'channel_index'
+        and SpikeTrains 'unit' (paths of the referencing objects). Unknown
+        values are None.
+
+        Example: the segments with spike trains of a unit::
+
+            set(st["parent"] for st in
+                io.list_objects("spiketrain", unit=unitpath))
+
+        :param objtype: Only list objects of this type
+        :param criteria: Only list objects whose entries equal the given
+         values. Callables are used as predicates on the entry values.
+        :return: List of dictionaries
+        """
+        objects = list()
+        for entry in self._read_manifest():
+            if objtype is not None and entry["type"] != objtype:
+                continue
+            matches = True
+            for key, expected in criteria.items():
+                value = entry.get(key)
+                if callable(expected):
+                    matches = expected(value)
+                else:
+                    matches = value == expected
+                if not matches:
+                    break
+            if matches:
+                objects.append(entry)
+        return objects
+
+    def _read_manifest(self):
+        """
+        Returns the manifest entries of all Blocks in the file.
+
+        :return: List of manifest entries
+        """
+        section = self._get_manifest_section()
+        entries = list()
+        for nix_block in self.nix_file.blocks:
+            entries.extend(self._read_block_manifest(nix_block, section))
+        return entries
+
+    def _read_block_manifest(self, nix_block, section):
+        """
+        Returns the manifest entries of one Block. Blocks without a valid
+        stored manifest are read lazily (by a copy of the IO, so the read
+        state of this IO is not touched).
+
+        :param nix_block: The NIX Block
+        :param section: The manifest Section or None
+        :return: List of manifest entries
+        """
+        entries = self._read_stored_manifest(nix_block.name, section)
+        if entries is not None:
+            return entries
+        reader = self._fork()
+        neo_block = reader.read_block("/" + nix_block.name, cascade=True,
+                                      lazy=True)
+        return self._build_manifest(neo_block)
+
+    def _read_stored_manifest(self, blockname, section=None):
+        """
+        Returns the stored manifest entries of a Block, or None if the Block
+        has no valid stored manifest.
+
+        :param blockname: Name of the Block
+        :param section: The manifest Section, if already resolved
+        :return: List of manifest entries or None
+        """
+        if section is None:
+            section = self._get_manifest_section()
+        if section is not None and blockname in section:
+            return json.loads(stringify(section[blockname]))
+        return None
+
+    def _get_manifest_section(self, create=False):
+        """
+        Returns the top-level manifest Section of the file, or None if it
+        does not exist and ``create`` is False.
+
+        :param create: Create the Section if it does not exist
+        :return: The manifest Section or None
+        """
+        sections = self.nix_file.sections
+        if self._manifest_section in sections:
+            section = sections[self._manifest_section]
+            if section.type == "neo.manifest":
+                return section
+            return None
+        if create:
+            return self.nix_file.create_section(self._manifest_section,
+                                                "neo.manifest")
+        return None
+
+    def _invalidate_manifest(self, blockname):
+        """
+        Removes the stored manifest of a Block before objects are written
+        to it. Listing the Block then reads it lazily until
+        :meth:`write_block` stores the manifest again.
+
+        :param blockname: Name of the Block
+        """
+        if blockname in self._manifest_invalid:
+            return
+        section = self._get_manifest_section()
+        if section is not None and blockname in section:
+            del section.props[blockname]
+        self._manifest_invalid.add(blockname)
+
+    def _write_manifest(self, block, previous):
+        """
+        Stores the manifest of a written Block as a JSON string property,
+        named after the Block, of the top-level 'neo.manifest' Section.
+        Objects that are in the file but not in the written Block keep their
+        ``previous`` entries. Without previous entries, the manifest is only
+        stored if the written Block has all objects of the NIX Block;
+        otherwise listing the Block reads it lazily.
+
+        :param block: The Neo Block that was written
+        :param previous: Stored manifest entries of the Block before it was
+         written, or None
+        """
+        entries = OrderedDict((entry["path"], entry)
+                              for entry in previous or [])
+        for entry in self._build_manifest(block):
+            entries[entry["path"]] = entry
+        if previous is None:
+            nix_block = self.nix_file.blocks[block.name]
+            if any(path not in entries
+                   for path in self._get_stored_paths(nix_block)):
+                return
+        section = self._get_manifest_section(create=True)
+        section[block.name] = nixio.Value(
+            json.dumps(list(entries.values()))
+        )
+        self._manifest_invalid.discard(block.name)
+        self._profile.count("metadata_property_writes")
+
+    def _get_stored_paths(self, nix_block):
+        """
+        Lists the paths of the Neo objects stored in a NIX Block. Only the
+        names and types of the NIX objects are read.
+
+        :param nix_block: The NIX Block
+        :return: List of paths
+        """
+        blockpath = "/" + nix_block.name
+        paths = [blockpath]
+        for group in nix_block.groups:
+            if group.type != "neo.segment":
+                continue
+            segpath = blockpath + "/segments/" + group.name
+            paths.append(segpath)
+            sigpaths = list(segpath + "/" + da.type[4:] + "s/" + da.name
+                            for da in group.data_arrays
+                            if da.type in ("neo.analogsignal",
+                                           "neo.irregularlysampledsignal"))
+            paths.extend(self._group_signals(sigpaths))
+            paths.extend(segpath + "/" + mtag.type[4:] + "s/" + mtag.name
+                         for mtag in group.multi_tags
+                         if mtag.type in ("neo.epoch", "neo.event",
+                                          "neo.spiketrain"))
+        for source in nix_block.sources:
+            if source.type != "neo.channelindex":
+                continue
+            chxpath = blockpath + "/channel_indexes/" + source.name
+            paths.append(chxpath)
+            paths.extend(chxpath + "/units/" + unit.name
+                         for unit in source.sources
+                         if unit.type == "neo.unit")
+        return paths
+
+    @classmethod
+    def _build_manifest(cls, block):
+        """
+        Describes a Block and all of its children with manifest entries
+        (see :meth:`list_objects`).
+
+        :param block: A Neo Block with the names used in the file
+        :return: List of manifest entries
+        """
+        blockpath = "/" + block.name
+        entries = [cls._manifest_entry(block, blockpath, None)]
+        references = dict()
+        for chx in block.channel_indexes:
+            chxpath = blockpath + "/channel_indexes/" + chx.name
+            entries.append(cls._manifest_entry(chx, chxpath, blockpath))
+            for sig in (chx.analogsignals + chx.irregularlysampledsignals):
+                references[id(sig)] = {"channel_index": chxpath}
+            for unit in chx.units:
+                unitpath = chxpath + "/units/" + unit.name
+                entries.append(cls._manifest_entry(unit, unitpath, chxpath))
+                for st in unit.spiketrains:
+                    references[id(st)] = {"unit": unitpath}
+        for seg in block.segments:
+            segpath = blockpath + "/segments/" + seg.name
+            entries.append(cls._manifest_entry(seg, segpath, blockpath))
+            for container in ("analogsignals", "irregularlysampledsignals",
+                              "epochs", "events", "spiketrains"):
+                for obj in getattr(seg, container):
+                    objpath = segpath + "/" + container + "/" + obj.name
+                    entry = cls._manifest_entry(obj, objpath, segpath)
+                    entry.update(references.get(id(obj), {}))
+                    entries.append(entry)
+        return entries
+
+    @classmethod
+    def _manifest_entry(cls, obj, path, parent):
+        """
+        Describes a single Neo object for the manifest. Lazy loaded objects
+        are described by their ``lazy_shape``; times that are not loaded
+        with them are None.
+
+        :param obj: The Neo object
+        :param path: Path of the object
+        :param parent: Path of the parent object or None
+        :return: dict
+        """
+        objtype = type(obj).__name__.lower()
+        entry = {"path": path, "type": objtype, "name": obj.name,
+                 "parent": parent}
+        if not isinstance(obj, pq.Quantity):
+            return entry
+
+        def seconds(t):
+            return t.rescale(pq.s).magnitude.item()
+
+        lazy_shape = getattr(obj, "lazy_shape", None)
+        entry["shape"] = list(lazy_shape or obj.shape)
+        entry["units"] = cls._get_units(obj)
+        t_start = t_stop = None
+        if isinstance(obj, SpikeTrain):
+            t_start, t_stop = seconds(obj.t_start), seconds(obj.t_stop)
+        elif lazy_shape is None and len(obj):
+            if isinstance(obj, (AnalogSignal, IrregularlySampledSignal)):
+                t_start, t_stop = seconds(obj.t_start), seconds(obj.t_stop)
+            elif isinstance(obj, Epoch):
+                t_start = seconds(obj.times.min())
+                t_stop = seconds((obj.times + obj.durations).max())
+            else:
+                t_start = seconds(obj.times.min())
+                t_stop = seconds(obj.times.max())
+        entry["t_start"], entry["t_stop"] = t_start, t_stop
+        if isinstance(obj, AnalogSignal):
+            entry["sampling_rate"] = None
+            if lazy_shape is None:
+                entry["sampling_rate"] = obj.sampling_rate.rescale(
+                    pq.Hz).magnitude.item()
+        if isinstance(obj, (AnalogSignal, IrregularlySampledSignal)):
+            entry["channel_index"] = None
+        elif isinstance(obj, SpikeTrain):
+            entry["unit"] = None
+        return entry
+
+    @profiled
     def load_lazy_object(self, obj):
         return self.get(obj.path, cascade=False, lazy=False)
 
+    @profiled
     def load_lazy_cascade(self, path, lazy):
         """
         Loads the object at the location specified by the path and all children.
@@ -496,6 +1368,63 @@ class NixIO(BaseIO):
         neoobj = self.get(path, cascade=True, lazy=lazy)
         return neoobj
 
+    def open_signal_stream(self, block, segment, name, sampling_rate, units,
+                           n_channels, t_start=0 * pq.s, dtype=np.float64,
+                           description=None):
+        """
+        Creates an empty AnalogSignal in the file and returns a
+        :class:`SignalStream` that appends samples to it as they arrive.
+        The Block and Segment are created if they do not exist yet. The
+        resulting signal is read like any other AnalogSignal.
+
+        :param block: Name of the Block that will contain the signal
+        :param segment: Name of the Segment that will contain the signal
+        :param name: Name of the new signal
+        :param sampling_rate: Sampling rate of the signal (Quantity)
+        :param units: Units of the signal data
+        :param n_channels: Number of channels
+        :param t_start: Time of the first sample (Quantity)
+        :param dtype: Data type of the stored samples
+        :param description: Description of the signal
+        :return: A SignalStream for the new signal
+        """
+        blockpath = "/" + block
+        segpath = blockpath + "/segments/" + segment
+        try:
+            self._get_object_at(blockpath)
+        except KeyError:
+            self.write_block(Block(name=block))
+        try:
+            self._get_object_at(segpath)
+        except KeyError:
+            self.write_segment(Segment(name=segment), blockpath)
+        sigpath = segpath + "/analogsignals/" + name
+        if self._get_object_at(sigpath):
+            raise ValueError("Signal {} already exists.".format(sigpath))
+
+        sampling_period = (1 / sampling_rate).rescale(pq.s)
+        attr = {
+            "name": name,
+            "type": "analogsignal",
+            "definition": description,
+            "data": np.empty((n_channels, 0), dtype=dtype),
+            "data.units": self._get_units(pq.Quantity(1, units)),
+            "sampling_interval": sampling_period.magnitude.item(),
+            "sampling_interval.units": self._get_units(sampling_period),
+            "t_start": t_start.magnitude.item(),
+            "t_start.units": self._get_units(t_start),
+            # streamed arrays grow, so they are chunked even with chunks=False
+            "resizable": True
+        }
+        nixobj = self._create_nix_obj(segpath, attr)
+        self._path_map[sigpath] = nixobj
+        self._invalidate_manifest(block)
+        self._write_attr_annotations(nixobj, attr, sigpath)
+        self._write_data(nixobj, attr, sigpath)
+        return SignalStream(nixobj, units, n_channels,
+                            self._is_matrix_signal(nixobj))
+
+    @profiled
     def write_all_blocks(self, neo_blocks):
         """
         Convert all ``neo_blocks`` to the NIX equivalent and write them to the
@@ -504,7 +1433,7 @@ class NixIO(BaseIO):
         :param neo_blocks: List (or iterable) containing Neo blocks
         :return: A list containing the new NIX Blocks
         """
-        self.resolve_name_conflicts(neo_blocks)
+        self._resolve_names(neo_blocks)
         for bl in neo_blocks:
             self.write_block(bl)
 
@@ -517,33 +1446,106 @@ class NixIO(BaseIO):
                 containerstr = "/channel_indexes/"
             else:
                 containerstr = "/" + type(obj).__name__.lower() + "s/"
-        self.resolve_name_conflicts(obj)
+        if self._writing_block is None:
+            self._resolve_names(obj)
+        if getattr(obj, "partial_read", False):
+            raise ValueError("{} '{}' was only partially read from the file "
+                             "and can't be written back.".format(
+                                 type(obj).__name__, obj.name))
         objpath = loc + containerstr + obj.name
+        if self._writing_block is None and not isinstance(obj, Block):
+            self._invalidate_manifest(objpath.split("/")[1])
         oldhash = self._object_hashes.get(objpath)
         if oldhash is None:
             try:
-                oldobj = self.get(objpath, cascade=False, lazy=False)
-                oldhash = self._hash_object(oldobj)
+                oldhash = self._get_stored_hash(objpath)
+                if oldhash is None:
+                    # written without a stored hash: compare contents
+                    oldobj = self.get(objpath, cascade=False, lazy=False)
+                    oldhash = self._compute_hash(oldobj)
             except (KeyError, IndexError):
                 oldhash = None
-        newhash = self._hash_object(obj)
+        newhash = self._compute_hash(obj)
         if oldhash != newhash:
             attr = self._neo_attr_to_nix(obj)
             if isinstance(obj, pq.Quantity):
                 attr.update(self._neo_data_to_nix(obj))
             if oldhash is None:
                 nixobj = self._create_nix_obj(loc, attr)
+                self._path_map[objpath] = nixobj
             else:
                 nixobj = self._get_object_at(objpath)
-            self._write_attr_annotations(nixobj, attr, objpath)
+            with self._profile.timer("metadata_write"):
+                self._write_attr_annotations(nixobj, attr, objpath)
             if isinstance(obj, pq.Quantity):
                 self._write_data(nixobj, attr, objpath)
+            if (isinstance(obj, SpikeTrain) and obj.waveforms is None and
+                    len(nixobj.features)):
+                # waveforms that were not read are kept in the file, so the
+                # hash of the written SpikeTrain doesn't describe it
+                self._remove_stored_hash(nixobj)
+            else:
+                self._write_stored_hash(nixobj, objpath, newhash)
         else:
             nixobj = self._get_object_at(objpath)
         self._object_map[id(obj)] = nixobj
         self._object_hashes[objpath] = newhash
+        self._section_cache.clear()
         self._write_cascade(obj, objpath)
 
+    def _resolve_names(self, objects):
+        """
+        Runs :meth:`resolve_name_conflicts` on ``objects`` as a profiled
+        phase.
+
+        :param objects: List of Neo objects or Neo container object
+        """
+        with self._profile.timer("name_conflicts"):
+            self.resolve_name_conflicts(objects)
+        self._profile.count("name_conflict_resolutions")
+
+    def _get_stored_hash(self, path):
+        """
+        Returns the content hash that was stored with the object at ``path``
+        when it was last written, or None if the object has no stored hash.
+        Raises KeyError or IndexError if the object does not exist.
+
+        :param path: Path to the object
+        :return: The stored hash or None
+        """
+        nixobj = self._get_object_at(path)
+        if isinstance(nixobj, list):
+            nixobj = nixobj[0]
+        metadata = nixobj.metadata
+        if metadata is not None and self._hash_property in metadata:
+            return metadata[self._hash_property]
+        return None
+
+    def _write_stored_hash(self, nixobj, path, objhash):
+        """
+        Stores the content hash of a written object in its metadata, so that
+        later sessions can detect changes without reading the object back.
+
+        :param nixobj: The NIX object (or list of DataArrays for signals)
+        :param path: Path to the object
+        :param objhash: The hash to store
+        """
+        if isinstance(nixobj, list):
+            nixobj = nixobj[0]
+        metadata = self._get_or_init_metadata(nixobj, path)
+        metadata[self._hash_property] = nixio.Value(objhash)
+
+    def _remove_stored_hash(self, nixobj):
+        """
+        Removes the stored content hash of an object, so that later sessions
+        compare its contents instead.
+
+        :param nixobj: The NIX object
+        """
+        metadata = nixobj.metadata
+        if metadata is not None and self._hash_property in metadata:
+            del metadata[self._hash_property]
+
     def _create_nix_obj(self, loc, attr):
         parentobj = self._get_object_at(loc)
         if attr["type"] == "block":
@@ -560,18 +1562,26 @@ class NixIO(BaseIO):
             typestr = "neo." + attr["type"]
             parentmd = self._get_or_init_metadata(parentobj, loc)
             sigmd = parentmd.create_section(attr["name"], typestr+".metadata")
-            for idx, datarow in enumerate(attr["data"]):
+            if self.signal_layout == "matrix":
+                # single (time x channel) DataArray
+                datarows = [np.transpose(attr["data"])]
+            else:
+                datarows = attr["data"]
+            for idx, datarow in enumerate(datarows):
                 name = "{}.{}".format(attr["name"], idx)
-                da = parentblock.create_data_array(name, typestr, data=datarow)
+                da = self._create_data_array(
+                    parentblock, name, typestr, data=datarow,
+                    resizable=attr.get("resizable", False)
+                )
                 da.metadata = sigmd
                 nixobj.append(da)
             parentobj.data_arrays.extend(nixobj)
         elif attr["type"] in ("epoch", "event", "spiketrain"):
             blockpath = "/" + loc.split("/")[1]
             parentblock = self._get_object_at(blockpath)
-            timesda = parentblock.create_data_array(
-                attr["name"]+".times", "neo."+attr["type"]+".times",
-                data=attr["data"]
+            timesda = self._create_data_array(
+                parentblock, attr["name"]+".times",
+                "neo."+attr["type"]+".times", data=attr["data"]
             )
             nixobj = parentblock.create_multi_tag(
                 attr["name"], "neo."+attr["type"], timesda
@@ -583,6 +1593,109 @@ class NixIO(BaseIO):
             raise ValueError("Unable to create NIX object. Invalid type.")
         return nixobj
 
+    def _create_data_array(self, parentblock, name, typestr, data=None,
+                           shape=None, dtype=None, resizable=False):
+        """
+        Creates a DataArray in ``parentblock``, applying the chunking and
+        compression options the IO was created with.
+        Either ``data`` or ``shape`` and ``dtype`` must be given.
+
+        :param parentblock: The NIX Block that will hold the DataArray
+        :param name: Name of the new DataArray
+        :param typestr: Type of the new DataArray
+        :param data: Data to write
+        :param shape: Shape of the (empty) DataArray if ``data`` is None
+        :param dtype: Data type of the (empty) DataArray if ``data`` is None
+        :param resizable: The DataArray must be resizable (e.g., for
+         streaming), so it is stored chunked even with ``chunks=False``
+        :return: The new DataArray
+        """
+        profile = self._profile
+        if data is not None:
+            profile.count("dataset_writes")
+            profile.count("bytes_written", np.asarray(data).nbytes)
+        with profile.timer("dataset_write"):
+            return self._allocate_data_array(parentblock, name, typestr,
+                                             data, shape, dtype, resizable)
+
+    def _allocate_data_array(self, parentblock, name, typestr, data=None,
+                             shape=None, dtype=None, resizable=False):
+        """
+        Creates the DataArray for :meth:`_create_data_array`.
+        """
+        if not self._storage_options:
+            if data is not None:
+                return parentblock.create_data_array(name, typestr, data=data)
+            return parentblock.create_data_array(name, typestr,
+                                                 dtype=dtype, shape=shape)
+        if data is not None:
+            data = np.asarray(data)
+            shape, dtype = data.shape, data.dtype
+        shape = tuple(shape)
+        nix_da = parentblock.create_data_array(name, typestr, dtype=dtype,
+                                               shape=(0,) * len(shape))
+        options = dict(self._storage_options)
+        chunks = options.pop("chunks", None)
+        if chunks is False and resizable:
+            chunks = None
+        if chunks is False:
+            maxshape = None
+            chunks = None
+        else:
+            maxshape = (None,) * len(shape)
+            if chunks is None or chunks is True:
+                chunks = True
+            else:
+                chunks = self._fit_chunks(chunks, shape)
+        self._replace_h5dataset(nix_da, shape=shape, dtype=dtype, data=data,
+                                chunks=chunks, maxshape=maxshape, **options)
+        return nix_da
+
+    @staticmethod
+    def _fit_chunks(chunks, shape):
+        """
+        Fits the ``chunks`` option (an integer or a tuple) to the rank of a
+        DataArray: extra chunk lengths are dropped and missing dimensions
+        are chunked whole.
+
+        :param chunks: Chunk length of the first dimension or tuple of
+         chunk lengths
+        :param shape: Shape of the DataArray
+        :return: Chunk shape tuple with one length per dimension
+        """
+        if np.ndim(chunks) == 0:
+            chunks = (int(chunks),)
+        chunks = tuple(chunks)[:len(shape)]
+        return chunks + tuple(max(1, n) for n in shape[len(chunks):])
+
+    @staticmethod
+    def _get_h5dataset(nix_da):
+        """
+        Returns the h5py Dataset that holds the data of a DataArray.
+
+        :param nix_da: A NIX DataArray (h5py backend)
+        :return: The h5py Dataset
+        """
+        # nixio has no public access to the underlying dataset; this and
+        # _replace_h5dataset are the only places that rely on its layout
+        return nix_da._h5group.group["data"]
+
+    @classmethod
+    def _replace_h5dataset(cls, nix_da, **h5options):
+        """
+        Replaces the h5py Dataset of a DataArray with a new one created with
+        the given h5py options. nixio only accepts a dtype, shape and data
+        for new DataArrays, so chunking and compression options can only be
+        applied by recreating the dataset it created.
+
+        :param nix_da: A NIX DataArray (h5py backend)
+        :param h5options: Keyword arguments for h5py create_dataset
+        """
+        h5group = cls._get_h5dataset(nix_da).parent
+        del h5group["data"]
+        h5group.create_dataset("data", **h5options)
+
+    @profiled
     def write_block(self, bl, loc=""):
         """
         Convert ``bl`` to the NIX equivalent and write it to the file.
@@ -590,9 +1703,28 @@ class NixIO(BaseIO):
         :param bl: Neo block to be written
         :param loc: Unused for blocks
         """
-        self._write_object(bl, loc)
-        self._create_references(bl)
-
+        self._resolve_names(bl)
+        blockname = bl.name
+        if blockname == self._manifest_section:
+            raise ValueError("The Block name '{}' is reserved for the "
+                             "manifest of the file.".format(blockname))
+        previous = None
+        if blockname not in self.nix_file.blocks:
+            previous = list()
+        elif self.manifest:
+            previous = self._read_stored_manifest(blockname)
+        # the stored manifest is invalid until the Block is fully written
+        self._invalidate_manifest(blockname)
+        self._writing_block = blockname
+        try:
+            self._write_object(bl, loc)
+            self._create_references(bl)
+        finally:
+            self._writing_block = None
+        if self.manifest:
+            self._write_manifest(bl, previous)
+
+    @profiled
     def write_channelindex(self, chx, loc=""):
         """
         Convert the provided ``chx`` (ChannelIndex) to a NIX Source and write it
@@ -603,6 +1735,7 @@ class NixIO(BaseIO):
         """
         self._write_object(chx, loc)
 
+    @profiled
     def write_segment(self, seg, loc=""):
         """
         Convert the provided ``seg`` to a NIX Group and write it to the NIX
@@ -613,6 +1746,7 @@ class NixIO(BaseIO):
         """
         self._write_object(seg, loc)
 
+    @profiled
     def write_indices(self, chx, loc=""):
         """
         Create NIX Source objects to represent individual indices based on the
@@ -623,6 +1757,21 @@ class NixIO(BaseIO):
         :param loc: Path to the CHX
         """
         nixsource = self._get_mapped_object(chx)
+        if self.channel_layout == "arrays":
+            self._write_indices_arrays(chx, nixsource, loc)
+        else:
+            self._write_indices_sources(chx, nixsource, loc)
+        self._section_cache.clear()
+
+    def _write_indices_sources(self, chx, nixsource, loc):
+        """
+        Writes each channel of ``chx`` as a child Source of the ChannelIndex
+        Source, with the index and coordinates in its metadata.
+
+        :param chx: The Neo ChannelIndex
+        :param nixsource: The NIX Source of the ChannelIndex
+        :param loc: Path to the CHX
+        """
         for idx, channel in enumerate(chx.index):
             if len(chx.channel_names):
                 channame = stringify(chx.channel_names[idx])
@@ -650,6 +1799,60 @@ class NixIO(BaseIO):
                 chanmd.create_property("coordinates", nixcoords)
                 chanmd["coordinates.units"] = nixcoordunits
 
+    def _write_indices_arrays(self, chx, nixsource, loc):
+        """
+        Writes the channels of ``chx`` as DataArrays that have the
+        ChannelIndex Source as their source: '<name>.index' holds the channel
+        indexes and '<name>.coordinates' the (channel x dimension)
+        coordinates. Channel names are stored as a single multi-valued
+        property of the ChannelIndex metadata.
+
+        :param chx: The Neo ChannelIndex
+        :param nixsource: The NIX Source of the ChannelIndex
+        :param loc: Path to the CHX
+        """
+        blockpath = "/" + loc.split("/")[1]
+        parentblock = self._get_object_at(blockpath)
+        indexname = nixsource.name + ".index"
+        coordname = nixsource.name + ".coordinates"
+        for daname in (indexname, coordname):
+            if daname in parentblock.data_arrays:
+                del parentblock.data_arrays[daname]
+
+        indexda = self._create_data_array(parentblock, indexname,
+                                          "neo.channelindex.index",
+                                          data=np.asarray(chx.index))
+        indexda.append_set_dimension()
+        indexda.sources.append(nixsource)
+
+        if chx.coordinates is not None and len(chx.coordinates):
+            coordunits = stringify(chx.coordinates[0][0].dimensionality)
+            if isinstance(chx.coordinates, pq.Quantity):
+                coords = chx.coordinates.rescale(coordunits).magnitude
+            else:
+                coords = np.array(list(
+                    list(c.rescale(coordunits).magnitude.item()
+                         for c in coord)
+                    for coord in chx.coordinates
+                ))
+            coordda = self._create_data_array(parentblock, coordname,
+                                              "neo.channelindex.coordinates",
+                                              data=coords)
+            coordda.unit = coordunits
+            coordda.append_set_dimension()
+            coordda.append_set_dimension()
+            coordda.sources.append(nixsource)
+
+        chxmd = self._get_or_init_metadata(nixsource, loc)
+        if "channel_names" in chxmd:
+            del chxmd["channel_names"]
+        if len(chx.channel_names):
+            chxmd.create_property(
+                "channel_names",
+                list(self._to_value(stringify(n)) for n in chx.channel_names)
+            )
+
+    @profiled
     def write_analogsignal(self, anasig, loc=""):
         """
         Convert the provided ``anasig`` (AnalogSignal) to a list of NIX
@@ -662,6 +1865,7 @@ class NixIO(BaseIO):
         """
         self._write_object(anasig, loc)
 
+    @profiled
     def write_irregularlysampledsignal(self, irsig, loc=""):
         """
         Convert the provided ``irsig`` (IrregularlySampledSignal) to a list of
@@ -676,6 +1880,7 @@ class NixIO(BaseIO):
         """
         self._write_object(irsig, loc)
 
+    @profiled
     def write_epoch(self, ep, loc=""):
         """
         Convert the provided ``ep`` (Epoch) to a NIX MultiTag and write it to
@@ -686,6 +1891,7 @@ class NixIO(BaseIO):
         """
         self._write_object(ep, loc)
 
+    @profiled
     def write_event(self, ev, loc=""):
         """
         Convert the provided ``ev`` (Event) to a NIX MultiTag and write it to
@@ -696,6 +1902,7 @@ class NixIO(BaseIO):
         """
         self._write_object(ev, loc)
 
+    @profiled
     def write_spiketrain(self, sptr, loc=""):
         """
         Convert the provided ``sptr`` (SpikeTrain) to a NIX MultiTag and write
@@ -706,6 +1913,7 @@ class NixIO(BaseIO):
         """
         self._write_object(sptr, loc)
 
+    @profiled
     def write_unit(self, ut, loc=""):
         """
         Convert the provided ``ut`` (Unit) to a NIX Source and write it to the
@@ -750,10 +1958,16 @@ class NixIO(BaseIO):
         for seg in block.segments:
             group = self._get_mapped_object(seg)
             group_signals = self._get_contained_signals(group)
+            if not group_signals:
+                continue
             for mtag in group.multi_tags:
                 if mtag.type in ("neo.epoch", "neo.event"):
-                    mtag.references.extend([sig for sig in group_signals
-                                            if sig not in mtag.references])
+                    # read the existing links once per MultiTag
+                    existing = set(ref.id for ref in mtag.references)
+                    missing = list(sig for sig in group_signals
+                                   if sig.id not in existing)
+                    if missing:
+                        mtag.references.extend(missing)
         for rcg in block.channel_indexes:
             rcgsource = self._get_mapped_object(rcg)
             das = self._get_mapped_objects(rcg.analogsignals +
@@ -761,16 +1975,28 @@ class NixIO(BaseIO):
             # flatten nested lists
             das = [da for dalist in das for da in dalist]
             for da in das:
-                if rcgsource not in da.sources:
-                    da.sources.append(rcgsource)
+                self._add_sources(da, [rcgsource])
             for unit in rcg.units:
                 unitsource = self._get_mapped_object(unit)
                 for st in unit.spiketrains:
                     stmtag = self._get_mapped_object(st)
-                    if rcgsource not in stmtag.sources:
-                        stmtag.sources.append(rcgsource)
-                    if unitsource not in stmtag.sources:
-                        stmtag.sources.append(unitsource)
+                    self._add_sources(stmtag, [rcgsource, unitsource])
+        self._referer_index.clear()
+
+    @staticmethod
+    def _add_sources(nixobj, sources):
+        """
+        Appends the given sources to ``nixobj`` unless already linked. The
+        existing links are read once for all new sources.
+
+        :param nixobj: NIX DataArray or MultiTag
+        :param sources: List of NIX Sources
+        """
+        existing = set(src.id for src in nixobj.sources)
+        for src in sources:
+            if src.id not in existing:
+                nixobj.sources.append(src)
+                existing.add(src.id)
 
     def _get_or_init_metadata(self, nix_obj, path):
         """
@@ -781,19 +2007,21 @@ class NixIO(BaseIO):
         :param path: Path to nix_obj
         :return: The metadata section of the provided object
         """
-        parent_parts = path.split("/")[:-2]
-        parent_path = "/".join(parent_parts)
-        if nix_obj.metadata is None:
+        metadata = nix_obj.metadata
+        if metadata is None:
+            parent_parts = path.split("/")[:-2]
+            parent_path = "/".join(parent_parts)
             if len(parent_parts) == 0:  # nix_obj is root block
                 parent_metadata = self.nix_file
             else:
                 obj_parent = self._get_object_at(parent_path)
                 parent_metadata = self._get_or_init_metadata(obj_parent,
                                                              parent_path)
-            nix_obj.metadata = parent_metadata.create_section(
+            metadata = parent_metadata.create_section(
                     nix_obj.name, nix_obj.type+".metadata"
             )
-        return nix_obj.metadata
+            nix_obj.metadata = metadata
+        return metadata
 
     def _get_object_at(self, path):
         """
@@ -812,11 +2040,29 @@ class NixIO(BaseIO):
         """
         if path in ("", "/"):
             return self.nix_file
+        profile = self._profile
+        profile.count("path_resolutions")
+        if path in self._path_map:
+            profile.count("path_cache_hits")
+            return self._path_map[path]
+        with profile.timer("path_resolution"):
+            return self._resolve_path(path)
+
+    def _resolve_path(self, path):
+        """
+        Looks up the object at the location defined by the path in the file
+        and adds it to the path cache. See :meth:`_get_object_at`.
+
+        :param path: Path string
+        :return: The object at the location defined by the path
+        """
         parts = path.split("/")
         if parts[0]:
             ValueError("Invalid object path: {}".format(path))
         if len(parts) == 2:  # root block
-            return self.nix_file.blocks[parts[1]]
+            obj = self.nix_file.blocks[parts[1]]
+            self._path_map[path] = obj
+            return obj
         parent_obj = self._get_parent(path)
         container_name = self._container_map[parts[-2]]
         parent_container = getattr(parent_obj, container_name)
@@ -831,6 +2077,9 @@ class NixIO(BaseIO):
                     break
         else:
             obj = parent_container[objname]
+        if not isinstance(obj, list) or len(obj):
+            # missing signals resolve to an empty list; don't cache those
+            self._path_map[path] = obj
         return obj
 
     def _get_parent(self, path):
@@ -867,9 +2116,11 @@ class NixIO(BaseIO):
         if "file_datetime" in attr:
             metadata = self._get_or_init_metadata(nixobj, path)
             metadata["file_datetime"] = self._to_value(attr["file_datetime"])
+            self._profile.count("metadata_property_writes")
         if "rec_datetime" in attr and attr["rec_datetime"]:
             metadata = self._get_or_init_metadata(nixobj, path)
             metadata["rec_datetime"] = self._to_value(attr["rec_datetime"])
+            self._profile.count("metadata_property_writes")
         if "annotations" in attr:
             metadata = self._get_or_init_metadata(nixobj, path)
             self._add_annotations(attr["annotations"], metadata)
@@ -900,7 +2151,8 @@ class NixIO(BaseIO):
                 exttype = nixobj.type + ".durations"
                 if extname in parentblock.data_arrays:
                     del parentblock.data_arrays[extname]
-                extents = parentblock.create_data_array(
+                extents = self._create_data_array(
+                    parentblock,
                     extname,
                     exttype,
                     data=attr["extents"]
@@ -922,10 +2174,24 @@ class NixIO(BaseIO):
                 if wfname in parentblock.data_arrays:
                     del parentblock.data_arrays[wfname]
                     del nixobj.features[0]
-                wfda = parentblock.create_data_array(
-                    wfname, "neo.waveforms",
-                    data=attr["waveforms"]
-                )
+                waveforms = attr["waveforms"]
+                step = self.waveform_write_size
+                if step and len(waveforms) > step:
+                    wfda = self._create_data_array(
+                        parentblock, wfname, "neo.waveforms",
+                        shape=waveforms.shape, dtype=waveforms.dtype
+                    )
+                    profile = self._profile
+                    for start in range(0, len(waveforms), step):
+                        wfchunk = waveforms[start:start+step]
+                        with profile.timer("dataset_write"):
+                            wfda[start:start+step] = wfchunk
+                        profile.count("dataset_writes")
+                        profile.count("bytes_written", wfchunk.nbytes)
+                else:
+                    wfda = self._create_data_array(
+                        parentblock, wfname, "neo.waveforms", data=waveforms
+                    )
                 wfda.unit = attr["waveforms.units"]
                 nixobj.create_feature(wfda, nixio.LinkType.Indexed)
                 wfda.append_set_dimension()
@@ -949,28 +2215,29 @@ class NixIO(BaseIO):
                     )
 
     def _update_maps(self, obj, lazy):
-        objidx = self._find_lazy_loaded(obj)
-        if lazy and objidx is None:
-            self._lazy_loaded.append(obj)
-        elif not lazy and objidx is not None:
-            self._lazy_loaded.pop(objidx)
-        if not lazy:
-            self._object_hashes[obj.path] = self._hash_object(obj)
+        path = getattr(obj, "path", None)
+        if path is None:
+            return
+        if lazy:
+            self._lazy_loaded.setdefault(path, obj)
+        else:
+            self._lazy_loaded.pop(path, None)
+        if not lazy and self.track_changes:
+            self._object_hashes[path] = self._compute_hash(obj)
 
     def _find_lazy_loaded(self, obj):
         """
-        Finds the index of an object in the _lazy_loaded list by comparing the
-        path attribute. Returns None if the object is not in the list.
+        Finds a lazy loaded object with the same path attribute as ``obj``.
+        Returns None if no object with that path was lazy loaded.
 
         :param obj: The object to find
-        :return: The index of the object in the _lazy_loaded list or None if it
+        :return: The lazy loaded object with the same path or None if it
         was not added
         """
-        for idx, llobj in enumerate(self._lazy_loaded):
-            if llobj.path == obj.path:
-                return idx
-        else:
+        path = getattr(obj, "path", None)
+        if path is None:
             return None
+        return self._lazy_loaded.get(path)
 
     @classmethod
     def resolve_name_conflicts(cls, objects):
@@ -979,7 +2246,8 @@ class NixIO(BaseIO):
         share the same name. Objects with no name are renamed based on their
         type.
         If a container object is supplied (Block, Segment, or RCG), conflicts
-        are resolved for the child objects.
+        are resolved for the child objects. For a Block, this includes the
+        children of its Segments and ChannelIndexes.
 
         :param objects: List of Neo objects or Neo container object
         """
@@ -987,19 +2255,25 @@ class NixIO(BaseIO):
             if not len(objects):
                 return
             names = [obj.name for obj in objects]
+            # multiset of the names currently in use
+            taken = Counter(names)
+            # next suffix to try for each base name
+            nextsuffix = dict()
             for idx, cn in enumerate(names):
                 if not cn:
                     cn = cls._generate_name(objects[idx])
                 else:
-                    names[idx] = ""
-                if cn not in names:
+                    taken[cn] -= 1
+                if not taken[cn]:
                     newname = cn
                 else:
-                    suffix = 1
+                    suffix = nextsuffix.get(cn, 1)
                     newname = "{}-{}".format(cn, suffix)
-                    while newname in names:
+                    while taken[newname]:
                         suffix += 1
                         newname = "{}-{}".format(cn, suffix)
+                    nextsuffix[cn] = suffix + 1
+                taken[newname] += 1
                 names[idx] = newname
             for obj, n in zip(objects, names):
                 obj.name = n
@@ -1018,6 +2292,8 @@ class NixIO(BaseIO):
                                    seg.epochs +
                                    seg.spiketrains)
             cls.resolve_name_conflicts(allchildren)
+            for chx in block.channel_indexes:
+                cls.resolve_name_conflicts(chx.units)
         elif isinstance(objects, Segment):
             seg = objects
             cls.resolve_name_conflicts(seg.analogsignals +
@@ -1078,9 +2354,7 @@ class NixIO(BaseIO):
         if hasattr(neoobj, "labels"):
             attr["labels"] = neoobj.labels.tolist()
         if hasattr(neoobj, "waveforms") and neoobj.waveforms is not None:
-            attr["waveforms"] = list(wf.magnitude for wf in
-                                     list(wfgroup for wfgroup in
-                                          neoobj.waveforms))
+            attr["waveforms"] = neoobj.waveforms.magnitude
             attr["waveforms.units"] = cls._get_units(neoobj.waveforms)
         if hasattr(neoobj, "left_sweep") and neoobj.left_sweep is not None:
             attr["left_sweep"] = neoobj.left_sweep.magnitude
@@ -1091,6 +2365,7 @@ class NixIO(BaseIO):
         for k, v in annotations.items():
             v = self._to_value(v)
             metadata[k] = v
+        self._profile.count("metadata_property_writes", len(annotations))
 
     def _to_value(self, v):
         """
@@ -1158,19 +2433,15 @@ class NixIO(BaseIO):
             units = None
         return units
 
-    @staticmethod
-    def _nix_attr_to_neo(nix_obj):
+    def _nix_attr_to_neo(self, nix_obj, metadata=None):
         neo_attrs = dict()
         neo_attrs["name"] = stringify(nix_obj.name)
 
         neo_attrs["description"] = stringify(nix_obj.definition)
-        if nix_obj.metadata:
-            for prop in nix_obj.metadata.props:
-                values = prop.values
-                if len(values) == 1:
-                    neo_attrs[prop.name] = values[0].value
-                else:
-                    neo_attrs[prop.name] = list(v.value for v in values)
+        if metadata is None:
+            metadata = nix_obj.metadata
+        if metadata is not None:
+            neo_attrs.update(self._read_section_props(metadata))
 
         if isinstance(nix_obj, (nixtypes["Block"], nixtypes["Group"])):
             if "rec_datetime" not in neo_attrs:
@@ -1185,6 +2456,43 @@ class NixIO(BaseIO):
         # neo_attrs["file_origin"] = os.path.basename(self.filename)
         return neo_attrs
 
+    def _read_section_props(self, section):
+        """
+        Reads all properties of a metadata Section in one pass and returns
+        them as a dictionary of values. Multi-valued properties are returned
+        as lists. The result is cached per Section, so that the attributes
+        and the sampling units of a signal (and repeated reads of an object)
+        share one read. At most ``_section_cache_size`` Sections are kept.
+
+        :param section: A NIX metadata Section
+        :return: Dictionary mapping property names to values
+        """
+        props = self._section_cache.get(section.id)
+        if props is None:
+            profile = self._profile
+            with profile.timer("metadata_read"):
+                props = dict()
+                for prop in section.props:
+                    if prop.name == self._hash_property:
+                        continue
+                    values = prop.values
+                    if len(values) == 1:
+                        props[prop.name] = values[0].value
+                    else:
+                        props[prop.name] = list(v.value for v in values)
+            profile.count("metadata_section_reads")
+            profile.count("metadata_property_reads", len(props))
+            self._section_cache[section.id] = props
+            while len(self._section_cache) > self._section_cache_size:
+                try:
+                    # drop the Sections that were read first
+                    self._section_cache.popitem(last=False)
+                except KeyError:
+                    break
+        # copy lists so that callers can't modify the cached values
+        return dict((k, list(v) if isinstance(v, list) else v)
+                    for k, v in props.items())
+
     @staticmethod
     def _group_signals(paths):
         """
@@ -1194,22 +2502,49 @@ class NixIO(BaseIO):
         :return: A list of paths (strings) of signal groups. The last part of
         each path is the common name of the signals in the group.
         """
-        grouppaths = list(".".join(p.split(".")[:-1])
-                          for p in paths)
-        # deduplicating paths
+        # deduplicating paths while keeping their order
+        seen = set()
         uniquepaths = []
-        for path in grouppaths:
-            if path not in uniquepaths:
-                uniquepaths.append(path)
+        for path in paths:
+            grouppath = path.rsplit(".", 1)[0]
+            if grouppath not in seen:
+                seen.add(grouppath)
+                uniquepaths.append(grouppath)
         return uniquepaths
 
     @staticmethod
-    def _get_referers(nix_obj, obj_list):
-        ref_list = list()
-        for ref in obj_list:
-            if nix_obj.name in list(src.name for src in ref.sources):
-                ref_list.append(ref)
-        return ref_list
+    def _is_matrix_signal(nix_da_group):
+        """
+        Checks whether a group of signal DataArrays uses the 'matrix' layout,
+        i.e., the whole signal is stored in a single two-dimensional
+        (time x channel) DataArray.
+
+        :param nix_da_group: a list of NIX DataArray objects
+        :return: True if the signal is stored as a single 2D DataArray
+        """
+        return (len(nix_da_group) == 1 and
+                len(nix_da_group[0].data_extent) == 2)
+
+    def _get_referers(self, nix_obj, nix_block, container):
+        """
+        Returns the objects in ``container`` (e.g., "data_arrays" or
+        "multi_tags") of ``nix_block`` that have ``nix_obj`` as a source.
+        The sources of all objects in the container are indexed once per block
+        and container; subsequent lookups use the index.
+
+        :param nix_obj: The referenced NIX object (Source)
+        :param nix_block: The NIX Block containing the referring objects
+        :param container: Name of the container attribute of the Block
+        :return: List of referring NIX objects
+        """
+        key = (nix_block.id, container)
+        if key not in self._referer_index:
+            index = dict()
+            for ref in getattr(nix_block, container):
+                for src in ref.sources:
+                    index.setdefault(src.id, []).append(ref)
+            self._referer_index[key] = index
+        return list(self._referer_index[key].get(nix_obj.id, []))
 
     @staticmethod
     def _get_time_dimension(obj):
@@ -1218,6 +2553,18 @@ class NixIO(BaseIO):
                 return dim
         return None
 
+    def _compute_hash(self, obj):
+        """
+        Computes the content hash of ``obj`` (see :meth:`_hash_object`).
+
+        :param obj: A Neo object
+        :return: The hash as a string
+        """
+        profile = self._profile
+        profile.count("hash_computations")
+        with profile.timer("hashing"):
+            return self._hash_object(obj)
+
     @staticmethod
     def _hash_object(obj):
         """
@@ -1293,3 +2640,278 @@ class NixIO(BaseIO):
         strupdate(type(obj).__name__)
 
         return objhash.hexdigest()
+
+
+def _read_block_worker(filename, path, options):
+    """
+    Reads one Block in a worker process of
+    :meth:`NixIO.read_all_blocks`.
+
+    :param filename: The NIX file
+    :param path: Path of the Block
+    :param options: Keyword arguments for the read-only NixIO
+    :return: The Neo Block
+    """
+    io = NixIO(filename, "ro", **options)
+    try:
+        return io.read_block(path, cascade=True, lazy=False)
+    finally:
+        io.nix_file.close()
+
+
+class SignalStream(object):
+    """
+    Appends chunks of samples to an AnalogSignal stored in a NIX file.
+    Only the chunk being written is held in memory.
+    Created by :meth:`NixIO.open_signal_stream`.
+    """
+
+    def __init__(self, nix_data_arrays, units, n_channels, matrix):
+        self._data_arrays = nix_data_arrays
+        self._matrix = matrix
+        self.units = units
+        self.n_channels = n_channels
+        self.n_samples = 0
+        self.closed = False
+
+    def append(self, samples):
+        """
+        Appends samples to the end of the signal.
+
+        :param samples: Array of shape (n_samples, n_channels). Quantities are
+         rescaled to the units of the signal.
+        """
+        if self.closed:
+            raise ValueError("Cannot append to a closed SignalStream.")
+        if isinstance(samples, pq.Quantity):
+            samples = samples.rescale(self.units).magnitude
+        samples = np.asarray(samples)
+        if samples.ndim == 1 and self.n_channels == 1:
+            samples = samples.reshape(-1, 1)
+        if samples.ndim != 2 or samples.shape[1] != self.n_channels:
+            raise ValueError("Expected samples of shape (n, {}), "
+                             "got {}.".format(self.n_channels, samples.shape))
+        start = self.n_samples
+        stop = start + len(samples)
+        if self._matrix:
+            da = self._data_arrays[0]
+            da.data_extent = (stop, self.n_channels)
+            da[start:stop] = samples
+        else:
+            for da, column in zip(self._data_arrays, np.transpose(samples)):
+                da.data_extent = (stop,)
+                da[start:stop] = column
+        self.n_samples = stop
+
+    def close(self):
+        self.closed = True
+        self._data_arrays = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AnalogSignalProxy(object):
+    """
+    Stands in for an AnalogSignal or IrregularlySampledSignal stored in a NIX
+    file. The proxy keeps the DataArrays of the signal and reads only the
+    requested samples and channels when it is indexed or loaded.
+    Created by :meth:`NixIO.get_proxy`.
+
+    Indexing with a slice selects samples, a tuple selects samples and
+    channels, e.g., ``proxy[1000:2000, [0, 3]]``. The result is always a Neo
+    signal object. It is not used by later reads of the IO (e.g., as the
+    signal of a ChannelIndex).
+    """
+
+    def __init__(self, io, path, nix_data_arrays):
+        self._io = io
+        self._data_arrays = nix_data_arrays
+        self._matrix = io._is_matrix_signal(nix_data_arrays)
+        self.path = path
+        self.name = path.split("/")[-1]
+
+    @property
+    def shape(self):
+        if self._matrix:
+            return tuple(self._data_arrays[0].data_extent)
+        return len(self._data_arrays[0]), len(self._data_arrays)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def load(self, t_start=None, t_stop=None, channel_indexes=None):
+        """
+        Reads the signal, or the requested time window and channels, from the
+        file.
+
+        :param t_start: Start of the time window to read (inclusive)
+        :param t_stop: End of the time window to read (exclusive)
+        :param channel_indexes: List of channel indexes to read
+        :return: The Neo signal
+        """
+        index = None
+        if t_start is not None or t_stop is not None:
+            index = self._io._get_sample_slice(self._data_arrays[0],
+                                               t_start, t_stop)
+        neo_signal = self._io._signal_da_to_neo(self._data_arrays, False,
+                                                index, channel_indexes,
+                                                register=False)
+        neo_signal.path = self.path
+        return neo_signal
+
+    def __getitem__(self, index):
+        nsamples, nchannels = self.shape
+        channel_indexes = None
+        if isinstance(index, tuple):
+            index, channels = index
+            if isinstance(channels, slice):
+                channel_indexes = list(range(*channels.indices(nchannels)))
+            elif isinstance(channels, (int, np.integer)):
+                channel_indexes = [channels]
+            else:
+                channel_indexes = list(channels)
+        if isinstance(index, (int, np.integer)):
+            index = range(nsamples)[index]
+            index = slice(index, index + 1)
+        if not isinstance(index, slice) or index.step not in (None, 1):
+            raise IndexError("Samples can only be selected with an integer "
+                             "or a contiguous slice.")
+        start, stop, _ = index.indices(nsamples)
+        neo_signal = self._io._signal_da_to_neo(self._data_arrays, False,
+                                                slice(start, stop),
+                                                channel_indexes,
+                                                register=False)
+        neo_signal.path = self.path
+        return neo_signal
+
+
+class SpikeTrainProxy(object):
+    """
+    Stands in for a SpikeTrain stored in a NIX file. The proxy keeps the
+    MultiTag of the SpikeTrain and reads only the requested spikes (times and
+    waveforms) when it is indexed or loaded. The SpikeTrains it returns are
+    not used by later reads of the IO (e.g., as the SpikeTrains of a Unit).
+    Created by :meth:`NixIO.get_proxy`.
+    """
+
+    def __init__(self, io, path, nix_mtag):
+        self._io = io
+        self._mtag = nix_mtag
+        self.path = path
+        self.name = nix_mtag.name
+
+    @property
+    def shape(self):
+        return tuple(self._mtag.positions.data_extent)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def load(self):
+        """
+        Reads the whole SpikeTrain from the file.
+
+        :return: The Neo SpikeTrain
+        """
+        spiketrain = self._io._mtag_eest_to_neo(self._mtag, False,
+                                                register=False)
+        spiketrain.path = self.path
+        return spiketrain
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            index = range(len(self))[index]
+            index = slice(index, index + 1)
+        if not isinstance(index, slice):
+            raise IndexError("Spikes can only be selected with an integer or "
+                             "a slice.")
+        spiketrain = self._io._mtag_eest_to_neo(self._mtag, False, index,
+                                                register=False)
+        spiketrain.path = self.path
+        return spiketrain
+
+
+class IOProfile(object):
+    """
+    Counters and timings collected by NixIO during a read or write call (see
+    ``NixIO(profile_callback=...)``) or a :meth:`NixIO.profile` block.
+
+    Counters:
+        path_resolutions, path_cache_hits: object lookups by path and how
+         many of them were served from the path cache
+        dataset_reads, bytes_read, mmap_reads: DataArray reads into memory,
+         their size, and memory-mapped reads
+        dataset_writes, bytes_written: DataArray writes and their size
+        hash_computations: Neo objects hashed for change tracking
+        metadata_section_reads, metadata_property_reads: metadata Sections
+         read (cache misses) and the properties in them
+        metadata_property_writes: annotations and datetimes written
+        name_conflict_resolutions: calls to resolve_name_conflicts
+
+    Timings (seconds): path_resolution, dataset_read, dataset_write, hashing,
+    metadata_read, metadata_write and name_conflicts. Nested calls of the
+    same phase are timed once.
+    """
+
+    active = True
+
+    def __init__(self, call):
+        self.call = call
+        self.seconds = 0.0
+        self.counts = Counter()
+        self.timings = defaultdict(float)
+        self._depth = Counter()
+
+    def count(self, key, amount=1):
+        self.counts[key] += amount
+
+    @contextmanager
+    def timer(self, key):
+        self._depth[key] += 1
+        start = time.time()
+        try:
+            yield
+        finally:
+            self._depth[key] -= 1
+            if not self._depth[key]:
+                self.timings[key] += time.time() - start
+
+    def report(self):
+        """
+        Returns the collected values as a dictionary.
+
+        :return: dict with the call name, total seconds, counts and timings
+        """
+        return {"call": self.call, "seconds": self.seconds,
+                "counts": dict(self.counts), "timings": dict(self.timings)}
+
+    def __repr__(self):
+        return "IOProfile({}: {:.6f}s, {})".format(self.call, self.seconds,
+                                                   dict(self.counts))
+
+
+class _NoProfile(object):
+    """
+    Stands in for an IOProfile while profiling is off; all calls do nothing.
+    """
+
+    active = False
+
+    def count(self, key, amount=1):
+        pass
+
+    def timer(self, key):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_no_profile = _NoProfile()
@@ -0,0 +1,337 @@
+# Copyright (c) 2014, German Neuroinformatics Node (G-Node)
+#                     Achilleas Koutsou <achilleas.k@gmail.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted under the terms of the BSD License. See
+# LICENSE file in the root of the Project.
+"""
+Benchmarks for the read and write paths of NixIO.
+
+Builds synthetic Blocks of configurable size, writes them to a NIX file and
+times writing, reading (eager, lazy and with a lazy cascade), partial
+rewrites and loading of lazy objects. The results are printed (or written
+to a file) as JSON, so runs with different sizes or IO options can be
+compared.
+
+Usage:
+    python -m neonix.test.benchmark_nixio [options]
+
+Run with ``--help`` for the list of options.
+"""
+from __future__ import print_function, division
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+try:
+    clock = time.perf_counter
+except AttributeError:
+    clock = time.time
+
+import numpy as np
+import quantities as pq
+
+from neo.core import (Block, Segment, ChannelIndex, AnalogSignal,
+                      IrregularlySampledSignal, Unit, SpikeTrain)
+
+from neonix.io.nixio import NixIO
+
+
+def make_blocks(n_blocks=1, n_segments=4, n_signals=4, n_channels=8,
+                n_samples=10000, n_spiketrains=4, n_spikes=1000,
+                waveform_samples=32, n_annotations=10):
+    """
+    Creates Blocks filled with random data.
+
+    :param n_blocks: Number of Blocks
+    :param n_segments: Number of Segments per Block
+    :param n_signals: Number of AnalogSignals and IrregularlySampledSignals
+     per Segment (each)
+    :param n_channels: Number of channels per signal
+    :param n_samples: Number of samples per signal
+    :param n_spiketrains: Number of SpikeTrains per Segment
+    :param n_spikes: Number of spikes per SpikeTrain
+    :param waveform_samples: Number of samples per waveform, 0 for no
+     waveforms
+    :param n_annotations: Number of annotations per object
+    :return: List of Blocks
+    """
+    def annotations():
+        return dict(("annotation{}".format(idx), float(idx))
+                    for idx in range(n_annotations))
+
+    blocks = list()
+    for bidx in range(n_blocks):
+        blk = Block(name="block{}".format(bidx), **annotations())
+        chx = ChannelIndex(name="chx{}".format(bidx),
+                           index=np.arange(n_channels))
+        blk.channel_indexes.append(chx)
+        units = list(Unit(name="unit{}".format(uidx), **annotations())
+                     for uidx in range(n_spiketrains))
+        chx.units.extend(units)
+        for sidx in range(n_segments):
+            seg = Segment(name="seg{}".format(sidx), **annotations())
+            blk.segments.append(seg)
+            for nidx in range(n_signals):
+                asig = AnalogSignal(
+                    signal=np.random.random((n_samples, n_channels)),
+                    units=pq.mV, sampling_rate=10 * pq.kHz,
+                    name="asig{}".format(nidx), **annotations()
+                )
+                seg.analogsignals.append(asig)
+                chx.analogsignals.append(asig)
+                times = np.cumsum(np.random.random(n_samples))
+                isig = IrregularlySampledSignal(
+                    times=times, units=pq.mV, time_units=pq.ms,
+                    signal=np.random.random((n_samples, n_channels)),
+                    name="isig{}".format(nidx), **annotations()
+                )
+                seg.irregularlysampledsignals.append(isig)
+                chx.irregularlysampledsignals.append(isig)
+            for nidx, unit in enumerate(units):
+                times = np.cumsum(np.random.random(n_spikes))
+                if waveform_samples:
+                    waveforms = pq.Quantity(
+                        np.random.random((n_spikes, 1, waveform_samples)),
+                        pq.mV
+                    )
+                else:
+                    waveforms = None
+                st = SpikeTrain(times=times, units=pq.ms,
+                                t_stop=times[-1] + 1, waveforms=waveforms,
+                                sampling_period=0.1 * pq.ms,
+                                name="st{}".format(nidx), **annotations())
+                seg.spiketrains.append(st)
+                unit.spiketrains.append(st)
+        blocks.append(blk)
+    return blocks
+
+
+def count_data(blocks):
+    """
+    Counts the Neo objects and the bytes of array data in the Blocks.
+
+    :param blocks: List of Blocks
+    :return: Tuple of (number of objects, number of bytes)
+    """
+    nobjects = 0
+    nbytes = 0
+    for blk in blocks:
+        nobjects += 1 + len(blk.channel_indexes)
+        nobjects += sum(len(chx.units) for chx in blk.channel_indexes)
+        for seg in blk.segments:
+            nobjects += 1
+            for sig in (seg.analogsignals + seg.irregularlysampledsignals):
+                nobjects += 1
+                nbytes += sig.nbytes
+                if isinstance(sig, IrregularlySampledSignal):
+                    nbytes += sig.times.nbytes
+            for st in seg.spiketrains:
+                nobjects += 1
+                nbytes += st.nbytes
+                if st.waveforms is not None:
+                    nbytes += st.waveforms.nbytes
+    return nobjects, nbytes
+
+
+def iter_data_objects(blocks):
+    for blk in blocks:
+        for seg in blk.segments:
+            for obj in itertools.chain(seg.analogsignals,
+                                       seg.irregularlysampledsignals,
+                                       seg.spiketrains):
+                yield obj
+
+
+def measure(func, repeat=1):
+    """
+    Runs ``func`` ``repeat`` times and keeps the fastest run. The function
+    is called with the run number and may return a callable that is timed
+    instead; this lets it do untimed setup (e.g. opening a file).
+    The peak memory is traced in one more run, so that tracing does not
+    slow down the timed runs.
+
+    :param func: The function to benchmark
+    :param repeat: Number of timed runs
+    :return: Tuple of (seconds, peak traced memory in bytes or None)
+    """
+    best = None
+    for run in range(repeat):
+        timed = func(run)
+        start = clock()
+        timed()
+        elapsed = clock() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    peak = None
+    if tracemalloc is not None:
+        timed = func(repeat)
+        tracemalloc.start()
+        try:
+            timed()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+
+def run(filename, blocks, repeat=1, modify_fraction=0.1, **iooptions):
+    """
+    Runs all benchmarks on the given Blocks.
+
+    :param filename: NIX file used for the benchmarks (overwritten)
+    :param blocks: List of Blocks to write and read back
+    :param repeat: Number of runs per benchmark; the fastest is reported
+    :param modify_fraction: Fraction of the data objects annotated before
+     the partial rewrite
+    :param iooptions: Keyword arguments for the NixIO constructor
+    :return: dict of results
+    """
+    nobjects, nbytes = count_data(blocks)
+    if not nobjects:
+        raise ValueError("Nothing to benchmark: the Blocks are empty.")
+    results = dict()
+    state = dict()
+
+    def record(name, elapsed, peak, nobj=nobjects, nbyt=nbytes):
+        results[name] = {
+            "seconds": elapsed,
+            "objects_per_second": nobj / elapsed if elapsed else None,
+            "mb_per_second": nbyt / 1e6 / elapsed if elapsed else None,
+            "peak_memory_bytes": peak,
+        }
+
+    def openio(mode):
+        closeio()
+        state["io"] = NixIO(filename, mode, **iooptions)
+        return state["io"]
+
+    def closeio():
+        if state.get("io") is not None:
+            state.pop("io").nix_file.close()
+
+    def write(run):
+        io = openio("ow")
+        return lambda: io.write_all_blocks(blocks)
+
+    def verify():
+        # make sure the phases run on the full data and not on an empty file
+        io = openio("ro")
+        nread = count_data(io.read_all_blocks())[0]
+        if nread != nobjects:
+            raise RuntimeError("The benchmark file contains {} objects, "
+                               "expected {}.".format(nread, nobjects))
+
+    def read(cascade, lazy):
+        def setup(run):
+            io = openio("ro")
+            return lambda: io.read_all_blocks(cascade=cascade, lazy=lazy)
+        return setup
+
+    def read_lazy_cascade(run):
+        io = openio("ro")
+
+        def timed():
+            for blk in io.read_all_blocks(cascade="lazy", lazy=False):
+                for _ in iter_data_objects([blk]):
+                    pass
+        return timed
+
+    def partial_write(run):
+        io = openio("rw")
+        neoblocks = io.read_all_blocks()
+        objects = list(iter_data_objects(neoblocks))
+        nmodify = int(round(len(objects) * modify_fraction))
+        for idx, obj in enumerate(objects[:nmodify]):
+            obj.annotate(benchmark_run=run, benchmark_index=idx)
+        return lambda: io.write_all_blocks(neoblocks)
+
+    def load_lazy(run):
+        io = openio("ro")
+        lazyobjects = list(iter_data_objects(io.read_all_blocks(lazy=True)))
+
+        def timed():
+            for obj in lazyobjects:
+                io.load_lazy_object(obj)
+        return timed
+
+    try:
+        record("write_block", *measure(write, repeat))
+        verify()
+        record("read_eager", *measure(read(True, False), repeat))
+        record("read_lazy", *measure(read(True, True), repeat), nbyt=0)
+        record("read_lazy_cascade", *measure(read_lazy_cascade, repeat))
+        record("partial_write", *measure(partial_write, repeat))
+        record("load_lazy_object", *measure(load_lazy, repeat))
+    finally:
+        closeio()
+    results["data"] = {"objects": nobjects, "bytes": nbytes,
+                       "file_bytes": os.path.getsize(filename)}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the NixIO read and write paths."
+    )
+    parser.add_argument("-o", "--output",
+                        help="write the JSON results to this file")
+    parser.add_argument("--filename", default="nixio_benchmark.h5")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--blocks", type=int, default=1)
+    parser.add_argument("--segments", type=int, default=4)
+    parser.add_argument("--signals", type=int, default=4)
+    parser.add_argument("--channels", type=int, default=8)
+    parser.add_argument("--samples", type=int, default=10000)
+    parser.add_argument("--spiketrains", type=int, default=4)
+    parser.add_argument("--spikes", type=int, default=1000)
+    parser.add_argument("--waveform-samples", type=int, default=32)
+    parser.add_argument("--annotations", type=int, default=10)
+    parser.add_argument("--modify-fraction", type=float, default=0.1)
+    parser.add_argument("--signal-layout", default="split",
+                        choices=("split", "matrix"))
+    parser.add_argument("--channel-layout", default="sources",
+                        choices=("sources", "arrays"))
+    parser.add_argument("--compression")
+    parser.add_argument("--keep", action="store_true",
+                        help="do not delete the benchmark file")
+    args = parser.parse_args(argv)
+
+    sizes = dict(n_blocks=args.blocks, n_segments=args.segments,
+                 n_signals=args.signals, n_channels=args.channels,
+                 n_samples=args.samples, n_spiketrains=args.spiketrains,
+                 n_spikes=args.spikes,
+                 waveform_samples=args.waveform_samples,
+                 n_annotations=args.annotations)
+    iooptions = dict(signal_layout=args.signal_layout,
+                     channel_layout=args.channel_layout,
+                     compression=args.compression)
+    blocks = make_blocks(**sizes)
+    try:
+        results = run(args.filename, blocks, args.repeat,
+                      args.modify_fraction, **iooptions)
+    finally:
+        if not args.keep and os.path.exists(args.filename):
+            os.remove(args.filename)
+    results["parameters"] = dict(sizes, repeat=args.repeat,
+                                 modify_fraction=args.modify_fraction,
+                                 **iooptions)
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as outfile:
+            outfile.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
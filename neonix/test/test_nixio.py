@@ -34,6 +34,7 @@ class NixIOTest(unittest.TestCase):
 
     filename = None
     io = None
+    test_ios = None
 
     def compare_blocks(self, neoblocks, nixblocks):
         for neoblock, nixblock in zip(neoblocks, nixblocks):
@@ -273,6 +274,39 @@ class NixIOTest(unittest.TestCase):
             for k, v, in neoobj.annotations.items():
                 self.assertEqual(nixmd[k], v)
 
+    def open_test_io(self, filename, mode="ow", **options):
+        """
+        Opens a NixIO on a file used only by the calling test. Opening the
+        same file again closes the NixIO opened before. The file is closed
+        and removed when the test ends.
+
+        :param filename: Name of the test file
+        :param mode: File access mode of the NixIO
+        :param options: Other keyword arguments for the NixIO
+        :return: The NixIO
+        """
+        if self.test_ios is None:
+            self.test_ios = dict()
+        if filename in self.test_ios:
+            self.test_ios.pop(filename).nix_file.close()
+        else:
+            self.addCleanup(self.close_test_io, filename)
+        io = NixIO(filename, mode, **options)
+        self.test_ios[filename] = io
+        return io
+
+    def close_test_io(self, filename):
+        io = self.test_ios.pop(filename, None)
+        if io is not None:
+            io.nix_file.close()
+        os.remove(filename)
+
+    def create_block_segment(self):
+        block = Block(name=self.rword())
+        seg = Segment(name=self.rword())
+        block.segments.append(seg)
+        return block, seg
+
     @classmethod
     def create_full_nix_file(cls, filename):
         nixfile = nixio.File.open(filename, nixio.FileMode.Overwrite)
@@ -383,7 +417,7 @@ class NixIOTest(unittest.TestCase):
                 "t_stop", nixio.Value(max(times_da).item()+1)
             )
 
-            waveforms = cls.rquant((10, 8, 5), 1)
+            waveforms = cls.rquant((len(times), 8, 5), 1)
             wfname = "{}.waveforms".format(mtag_st.name)
             wfda = blk.create_data_array(wfname, "neo.waveforms",
                                          data=waveforms)
@@ -628,6 +662,31 @@ class NixIOWriteTest(NixIOTest):
         chx.annotate(**self.rdict(3))
         self.write_and_compare([block])
 
+    def test_channel_index_arrays_write(self):
+        io = self.open_test_io("nixio_testfile_chxarrays.h5",
+                               channel_layout="arrays")
+        block = Block(name=self.rword())
+        chx = ChannelIndex(name=self.rword(),
+                           index=[1, 2, 3, 5, 8, 13],
+                           channel_names=self.rsentence(6).split(" "),
+                           coordinates=self.rquant((6, 3), pq.um))
+        block.channel_indexes.append(chx)
+        io.write_block(block)
+
+        nixblock = io.nix_file.blocks[0]
+        nixsrc = nixblock.sources[0]
+        self.assertEqual(len(nixsrc.sources), 0)
+        self.assertIn(nixsrc.name + ".index", nixblock.data_arrays)
+
+        neochx = io.read_block("/" + block.name).channel_indexes[0]
+        np.testing.assert_equal(neochx.index, chx.index)
+        self.assertEqual(list(neochx.channel_names),
+                         list(np.array(chx.channel_names, dtype="S")))
+        np.testing.assert_almost_equal(
+            neochx.coordinates.rescale(pq.um).magnitude,
+            chx.coordinates.magnitude
+        )
+
     def test_signals_write(self):
         block = Block()
         seg = Segment()
@@ -668,6 +727,157 @@ class NixIOWriteTest(NixIOTest):
         )
         self.write_and_compare([block, anotherblock])
 
+    def test_signals_write_matrix(self):
+        io = self.open_test_io("nixio_testfile_matrix.h5",
+                               signal_layout="matrix")
+        block, seg = self.create_block_segment()
+        asig = AnalogSignal(signal=self.rquant((10, 4), pq.mV),
+                            sampling_rate=pq.Quantity(10, "Hz"),
+                            name="matrix signal")
+        seg.analogsignals.append(asig)
+        irsig = IrregularlySampledSignal(
+            signal=np.random.random((20, 3)),
+            times=self.rquant(20, pq.ms, True),
+            units=pq.A, name="matrix irsig"
+        )
+        seg.irregularlysampledsignals.append(irsig)
+        io.write_block(block)
+
+        nixgroup = io.nix_file.blocks[0].groups[0]
+        self.assertEqual(len(nixgroup.data_arrays), 2)
+        for da in nixgroup.data_arrays:
+            self.assertEqual(len(da.data_extent), 2)
+            self.assertIsInstance(da.dimensions[1], nixtypes["SetDimension"])
+
+        neoseg = io.read_all_blocks()[0].segments[0]
+        np.testing.assert_almost_equal(neoseg.analogsignals[0].magnitude,
+                                       asig.magnitude)
+        self.assertEqual(neoseg.analogsignals[0].sampling_period,
+                         asig.sampling_period)
+        np.testing.assert_almost_equal(
+            neoseg.irregularlysampledsignals[0].magnitude, irsig.magnitude
+        )
+        np.testing.assert_almost_equal(
+            neoseg.irregularlysampledsignals[0].times.magnitude,
+            irsig.times.magnitude
+        )
+
+        # only the selected columns are read, in the requested order
+        path = "/{}/segments/{}/analogsignals/matrix signal".format(
+            block.name, seg.name
+        )
+        with io.profile() as profile:
+            window = io.read_analogsignal(path, channel_indexes=[3, 1, 3])
+        np.testing.assert_almost_equal(window.magnitude,
+                                       asig.magnitude[:, [3, 1, 3]])
+        self.assertEqual(profile.counts["bytes_read"],
+                         asig.magnitude[:, [1, 3]].nbytes)
+
+    def test_storage_options_write(self):
+        io = self.open_test_io("nixio_testfile_storage.h5", chunks=16,
+                               compression="gzip", compression_opts=4,
+                               shuffle=True)
+        block, seg = self.create_block_segment()
+        asig = AnalogSignal(signal=self.rquant((100, 2), pq.mV),
+                            sampling_rate=pq.kHz)
+        seg.analogsignals.append(asig)
+        st = SpikeTrain(times=self.rquant(50, pq.ms, True), t_stop=100 * pq.s,
+                        waveforms=self.rquant((50, 2, 8), pq.mV))
+        seg.spiketrains.append(st)
+        io.write_block(block)
+
+        nixblock = io.nix_file.blocks[0]
+        for da in nixblock.data_arrays:
+            dset = NixIO._get_h5dataset(da)
+            self.assertEqual(dset.compression, "gzip")
+            self.assertTrue(dset.shuffle)
+            self.assertEqual(dset.chunks[0], 16)
+        neoseg = io.read_block("/" + block.name).segments[0]
+        np.testing.assert_almost_equal(neoseg.analogsignals[0].magnitude,
+                                       asig.magnitude)
+        np.testing.assert_almost_equal(neoseg.spiketrains[0].magnitude,
+                                       st.magnitude)
+        np.testing.assert_almost_equal(neoseg.spiketrains[0].waveforms,
+                                       st.waveforms)
+
+    def test_storage_chunk_shape_write(self):
+        io = self.open_test_io("nixio_testfile_chunkshape.h5",
+                               signal_layout="matrix", chunks=(16, 2))
+        block, seg = self.create_block_segment()
+        asig = AnalogSignal(signal=self.rquant((100, 3), pq.mV),
+                            sampling_rate=pq.kHz, name="asig")
+        seg.analogsignals.append(asig)
+        st = SpikeTrain(times=self.rquant(50, pq.ms, True), t_stop=100 * pq.s,
+                        waveforms=self.rquant((50, 4, 8), pq.mV), name="st")
+        seg.spiketrains.append(st)
+        ev = Event(times=self.rquant(10, pq.s, True),
+                   labels=np.array(list("abcdefghij")), name="ev")
+        seg.events.append(ev)
+        io.write_block(block)
+
+        nixblock = io.nix_file.blocks[0]
+        chunkshapes = dict((da.name, NixIO._get_h5dataset(da).chunks)
+                           for da in nixblock.data_arrays)
+        self.assertEqual(chunkshapes["asig.0"], (16, 2))
+        self.assertEqual(chunkshapes["st.times"], (16,))
+        self.assertEqual(chunkshapes["st.waveforms"], (16, 2, 8))
+        self.assertEqual(chunkshapes["ev.times"], (16,))
+        neoseg = io.read_block("/" + block.name).segments[0]
+        np.testing.assert_almost_equal(neoseg.analogsignals[0].magnitude,
+                                       asig.magnitude)
+        np.testing.assert_almost_equal(neoseg.spiketrains[0].waveforms,
+                                       st.waveforms)
+        np.testing.assert_almost_equal(neoseg.events[0].magnitude,
+                                       ev.magnitude)
+
+    def test_signal_stream_write(self):
+        chunks = list(self.rquant((50, 4), pq.mV) for _ in range(3))
+        with self.writer.open_signal_stream("stream block", "stream seg",
+                                            "streamed", 1 * pq.kHz, "mV",
+                                            4, t_start=2 * pq.s) as stream:
+            for chunk in chunks:
+                stream.append(chunk)
+            self.assertEqual(stream.n_samples, 150)
+            self.assertRaises(ValueError, stream.append,
+                              np.zeros((10, 3)))
+
+        path = "/stream block/segments/stream seg/analogsignals/streamed"
+        asig = self.writer.read_analogsignal(path)
+        self.assertEqual(np.shape(asig), (150, 4))
+        np.testing.assert_almost_equal(asig.magnitude,
+                                       np.concatenate(chunks).magnitude)
+        self.assertEqual(asig.t_start, 2 * pq.s)
+        self.assertAlmostEqual(
+            asig.sampling_period.rescale(pq.ms).magnitude.item(), 1
+        )
+
+    def test_signal_stream_contiguous_write(self):
+        io = self.open_test_io("nixio_testfile_stream.h5", chunks=False)
+        stream = io.open_signal_stream("blk", "seg", "streamed", pq.kHz,
+                                       "mV", 2)
+        stream.append(self.rquant((20, 2), pq.mV))
+        stream.append(self.rquant((5, 2), pq.mV))
+        stream.close()
+        asig = io.read_analogsignal("/blk/segments/seg/analogsignals/streamed")
+        self.assertEqual(np.shape(asig), (25, 2))
+
+    def test_mmap_read(self):
+        filename = "nixio_testfile_mmap.h5"
+        io = self.open_test_io(filename, signal_layout="matrix", chunks=False)
+        block, seg = self.create_block_segment()
+        asig = AnalogSignal(signal=self.rquant((100, 4), pq.mV),
+                            sampling_rate=pq.kHz, name="contiguous")
+        seg.analogsignals.append(asig)
+        io.write_block(block)
+
+        io = self.open_test_io(filename, "ro", mmap=True)
+        path = "/{}/segments/{}/analogsignals/contiguous".format(block.name,
+                                                                 seg.name)
+        mmsig = io.read_analogsignal(path)
+        np.testing.assert_almost_equal(mmsig.magnitude, asig.magnitude)
+        # views of the read-only mapping are not writeable
+        self.assertFalse(mmsig.flags.writeable)
+
     def test_epoch_write(self):
         block = Block()
         seg = Segment()
@@ -714,6 +924,147 @@ class NixIOWriteTest(NixIOTest):
         spiketrain.left_sweep = np.random.random(10)*pq.ms
         self.write_and_compare([block])
 
+    def test_stored_hash_write(self):
+        block = Block(name=self.rword())
+        seg = Segment(name=self.rword())
+        block.segments.append(seg)
+        seg.analogsignals.append(
+            AnalogSignal(signal=self.rquant((10, 3), pq.mV),
+                         sampling_rate=pq.Hz)
+        )
+        seg.spiketrains.append(SpikeTrain(times=[1, 2] * pq.s,
+                                          t_stop=3 * pq.s))
+        self.writer.write_block(block)
+        nixblock = self.writer.nix_file.blocks[0]
+        self.assertIn(NixIO._hash_property, nixblock.metadata)
+        self.assertIn(NixIO._hash_property, nixblock.groups[0].metadata)
+
+        # unchanged objects are detected without reading them back
+        self.writer._object_hashes.clear()
+        self.writer.get = mock.Mock()
+        self.writer._write_attr_annotations = mock.Mock()
+        self.writer.write_block(block)
+        self.writer.get.assert_not_called()
+        self.writer._write_attr_annotations.assert_not_called()
+
+        neoblock = self.writer.read_block("/" + block.name)
+        self.assertNotIn(NixIO._hash_property, neoblock.annotations)
+
+    def test_manifest_write(self):
+        block = Block(name="mfblock")
+        chx = ChannelIndex(name="mfchx", index=[0, 1])
+        block.channel_indexes.append(chx)
+        unit = Unit(name="mfunit")
+        chx.units.append(unit)
+        for segname in ("seg-a", "seg-b"):
+            seg = Segment(name=segname)
+            block.segments.append(seg)
+            asig = AnalogSignal(signal=self.rquant((10, 2), pq.mV),
+                                sampling_rate=pq.kHz, name="sig")
+            seg.analogsignals.append(asig)
+            chx.analogsignals.append(asig)
+        st = SpikeTrain(times=[1, 2] * pq.ms, t_stop=3 * pq.ms, name="st")
+        block.segments[1].spiketrains.append(st)
+        unit.spiketrains.append(st)
+        self.writer.write_block(block)
+
+        self.writer.read_block = mock.Mock()
+        unitpath = "/mfblock/channel_indexes/mfchx/units/mfunit"
+        sts = self.writer.list_objects("spiketrain", unit=unitpath)
+        self.assertEqual(list(st["parent"] for st in sts),
+                         ["/mfblock/segments/seg-b"])
+        self.assertAlmostEqual(sts[0]["t_stop"], 0.003)
+        sigs = self.writer.list_objects("analogsignal",
+                                        shape=lambda shape: shape[0] == 10)
+        self.assertEqual(len(sigs), 2)
+        self.assertEqual(sigs[0]["sampling_rate"], 1000)
+        self.assertEqual(sigs[0]["channel_index"],
+                         "/mfblock/channel_indexes/mfchx")
+        self.writer.read_block.assert_not_called()
+        del self.writer.read_block
+
+        # objects written outside of write_block are listed as well
+        stream = self.writer.open_signal_stream("mfblock", "seg-a", "live",
+                                                pq.kHz, "mV", 2)
+        stream.append(self.rquant((5, 2), pq.mV))
+        livepath = "/mfblock/segments/seg-a/analogsignals/live"
+        paths = list(sig["path"] for sig in
+                     self.writer.list_objects("analogsignal"))
+        self.assertIn(livepath, paths)
+        self.assertEqual(len(paths), 3)
+
+        # rewriting the Block keeps listing the objects it doesn't have
+        self.writer.write_block(block)
+        paths = list(sig["path"] for sig in
+                     self.writer.list_objects("analogsignal"))
+        self.assertIn(livepath, paths)
+
+        # Blocks without a stored manifest are not read when written
+        other = Block(name="mfother")
+        other.segments.append(Segment(name="seg"))
+        self.writer.manifest = False
+        self.writer.write_block(other)
+        self.writer.manifest = True
+        self.writer._fork = mock.Mock()
+        self.writer.write_block(other)
+        self.writer._fork.assert_not_called()
+        del self.writer._fork
+        section = self.writer.nix_file.sections[NixIO._manifest_section]
+        self.assertIn("mfother", section)
+        self.assertNotIn("mfblock", section)
+
+        self.assertRaises(ValueError, self.writer.write_block,
+                          Block(name=NixIO._manifest_section))
+
+    def test_waveforms_chunked_write(self):
+        io = self.open_test_io("nixio_testfile_waveforms.h5",
+                               waveform_write_size=7)
+        block, seg = self.create_block_segment()
+        waveforms = self.rquant((30, 4, 12), pq.mV)
+        st = SpikeTrain(times=self.rquant(30, pq.ms, True), t_stop=100 * pq.s,
+                        waveforms=waveforms, name="wfspikes")
+        seg.spiketrains.append(st)
+        io.write_block(block)
+
+        nixwf = io.nix_file.blocks[0].data_arrays["wfspikes.waveforms"]
+        np.testing.assert_almost_equal(nixwf[:], waveforms.magnitude)
+
+    def test_waveforms_skipped_rewrite(self):
+        filename = "nixio_testfile_nowaveforms.h5"
+        io = self.open_test_io(filename)
+        block, seg = self.create_block_segment()
+        waveforms = self.rquant((10, 2, 6), pq.mV)
+        st = SpikeTrain(times=self.rquant(10, pq.ms, True), t_stop=100 * pq.s,
+                        waveforms=waveforms, name="wfspikes")
+        seg.spiketrains.append(st)
+        io.write_block(block)
+
+        io = self.open_test_io(filename, "rw", load_waveforms=False)
+        stpath = "/{}/segments/{}/spiketrains/wfspikes".format(
+            block.name, seg.name
+        )
+        neo_blocks = io.read_all_blocks(lazy=True)
+        self.assertIn(stpath, io._lazy_loaded)
+        neo_blocks = io.read_all_blocks()
+        neost = neo_blocks[0].segments[0].spiketrains[0]
+        self.assertIs(neost.waveforms, None)
+        self.assertNotIn(stpath, io._lazy_loaded)
+        self.assertIn(stpath, io._object_hashes)
+
+        # unchanged SpikeTrains are not rewritten
+        io._write_attr_annotations = mock.Mock()
+        io.write_all_blocks(neo_blocks)
+        io._write_attr_annotations.assert_not_called()
+        del io._write_attr_annotations
+
+        # changed ones keep their waveforms but not a hash that ignores them
+        neost.annotate(changed=True)
+        io.write_all_blocks(neo_blocks)
+        nixmtag = io.nix_file.blocks[0].groups[0].multi_tags["wfspikes"]
+        np.testing.assert_almost_equal(nixmtag.features[0].data[:],
+                                       waveforms.magnitude)
+        self.assertNotIn(NixIO._hash_property, nixmtag.metadata)
+
     def test_metadata_structure_write(self):
         neoblk = self.create_all_annotated()
         self.io.write_block(neoblk)
@@ -784,6 +1135,37 @@ class NixIOWriteTest(NixIOTest):
         self.writer.write_all_blocks(blocks)
         self.compare_blocks(blocks, self.reader.blocks)
 
+    def test_name_conflicts(self):
+        sts = list(SpikeTrain(times=[1] * pq.s, t_stop=pq.s)
+                   for _ in range(100))
+        sts[10].name = "neo.SpikeTrain-1"
+        sts[20].name = "spikes"
+        sts[30].name = "spikes"
+        NixIO.resolve_name_conflicts(sts)
+        names = list(st.name for st in sts)
+        self.assertEqual(len(set(names)), len(names))
+        self.assertEqual(names[0], "neo.SpikeTrain")
+        self.assertEqual(names[1], "neo.SpikeTrain-2")
+        self.assertEqual(names[10], "neo.SpikeTrain-1")
+        self.assertEqual(names[20], "spikes-1")
+        self.assertEqual(names[30], "spikes")
+
+    def test_name_conflicts_write(self):
+        block = Block()
+        seg = Segment()
+        block.segments.append(seg)
+        seg.spiketrains.extend(SpikeTrain(times=[1] * pq.s, t_stop=pq.s,
+                                          name="spikes") for _ in range(3))
+        chx = ChannelIndex(index=[0])
+        block.channel_indexes.append(chx)
+        chx.units.extend(Unit(name="unit") for _ in range(2))
+        with self.writer.profile() as profile:
+            self.writer.write_block(block)
+        self.assertEqual(profile.counts["name_conflict_resolutions"], 1)
+        self.assertEqual(len(set(st.name for st in seg.spiketrains)), 3)
+        self.assertEqual(len(set(unit.name for unit in chx.units)), 2)
+        self.compare_blocks([block], self.reader.blocks)
+
     def test_to_value(self):
         section = self.io.nix_file.create_section("Metadata value test", "Test")
         tovalue = self.io._to_value
@@ -930,6 +1312,187 @@ class NixIOReadTest(NixIOTest):
             nix_block = self.io.nix_file.blocks[block.name]
             self.compare_attr(block, nix_block)
 
+    def test_signal_window_read(self):
+        blk = self.io.nix_file.blocks[0]
+        group = blk.groups[0]
+        segpath = "/" + blk.name + "/segments/" + group.name
+        asigname = next(da.metadata.name for da in group.data_arrays
+                        if da.type == "neo.analogsignal")
+        path = segpath + "/analogsignals/" + asigname
+        full = self.io.read_analogsignal(path)
+        window = self.io.read_analogsignal(path, t_start=10.1 * pq.ms,
+                                           t_stop=10.3 * pq.ms,
+                                           channel_indexes=[2, 0])
+        self.assertEqual(np.shape(window), (20, 2))
+        np.testing.assert_almost_equal(window.magnitude,
+                                       full.magnitude[10:30][:, [2, 0]])
+        self.assertAlmostEqual(window.t_start.rescale(pq.ms).magnitude.item(),
+                               10.1)
+
+        isigname = next(da.metadata.name for da in group.data_arrays
+                        if da.type == "neo.irregularlysampledsignal")
+        path = segpath + "/irregularlysampledsignals/" + isigname
+        full = self.io.read_irregularlysampledsignal(path)
+        t_start, t_stop = full.times[50], full.times[150]
+        window = self.io.read_irregularlysampledsignal(path, t_start=t_start,
+                                                       t_stop=t_stop)
+        self.assertEqual(np.shape(window), (100, 10))
+        np.testing.assert_almost_equal(window.magnitude,
+                                       full.magnitude[50:150])
+        np.testing.assert_almost_equal(window.times.magnitude,
+                                       full.times.magnitude[50:150])
+
+    def test_spiketrain_window_read(self):
+        blk = self.io.nix_file.blocks[0]
+        group = blk.groups[0]
+        segpath = "/" + blk.name + "/segments/" + group.name
+        stname = next(mt.name for mt in group.multi_tags
+                      if mt.type == "neo.spiketrain")
+        path = segpath + "/spiketrains/" + stname
+        full = self.io.read_spiketrain(path)
+        window = self.io.read_spiketrain(path, t_start=full.times[2],
+                                         t_stop=full.times[7])
+        np.testing.assert_almost_equal(window.magnitude, full.magnitude[2:7])
+        np.testing.assert_almost_equal(window.waveforms.magnitude,
+                                       full.waveforms.magnitude[2:7])
+
+        self.assertTrue(window.partial_read)
+        self.assertIsNot(self.io._object_map[
+            self.io._get_object_at(path).id], window)
+        self.assertRaises(ValueError, self.io.write_spiketrain, window,
+                          segpath)
+        lazywindow = self.io.read_spiketrain(path, lazy=True,
+                                             t_start=full.times[2],
+                                             t_stop=full.times[7])
+        self.assertEqual(lazywindow.lazy_shape, (5,))
+
+        nowf = self.io.read_spiketrain(path, load_waveforms=False)
+        self.assertIs(nowf.waveforms, None)
+        np.testing.assert_almost_equal(nowf.magnitude, full.magnitude)
+
+    def test_profile_read(self):
+        with self.io.profile() as profile:
+            self.io.read_all_blocks(cascade=True, lazy=False)
+        counts = profile.counts
+        self.assertGreater(counts["path_resolutions"], 0)
+        self.assertGreater(counts["dataset_reads"], 0)
+        self.assertGreater(counts["bytes_read"], 0)
+        self.assertGreater(counts["metadata_property_reads"], 0)
+        self.assertEqual(counts["hash_computations"], 0)
+        self.assertIn("dataset_read", profile.timings)
+
+        reports = list()
+        io = NixIO(self.filename, "ro", profile_callback=reports.append)
+        io.read_all_blocks(cascade=True, lazy=True)
+        io.nix_file.close()
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0].call, "read_all_blocks")
+        self.assertEqual(reports[0].counts["dataset_reads"], 0)
+
+    def test_parallel_read(self):
+        # workers that are not forked can't open the class file while it is
+        # open for writing, so the Blocks are read from a closed copy
+        filename = "testfile_parallelread.h5"
+        self.create_full_nix_file(filename).close()
+        rwio = self.open_test_io(filename, "rw")
+        with self.assertRaises(ValueError):
+            rwio.read_all_blocks(workers=2)
+
+        io = self.open_test_io(filename, "ro")
+        # a timeout keeps a broken worker pool from blocking the test run
+        neo_blocks = io.read_all_blocks(cascade=True, lazy=False,
+                                        workers=2, timeout=120)
+        self.compare_blocks(neo_blocks, io.nix_file.blocks)
+        for neoblock, nixblock in zip(neo_blocks, io.nix_file.blocks):
+            segpath = "/{}/segments/{}".format(nixblock.name,
+                                               nixblock.groups[0].name)
+            self.assertEqual(neoblock.segments[0].path, segpath)
+            st = neoblock.segments[0].spiketrains[0]
+            self.assertEqual(st.path, segpath + "/spiketrains/" + st.name)
+
+    def test_session_read(self):
+        import threading
+        results = list()
+
+        def read():
+            session = self.io.session()
+            results.append(session.read_all_blocks(cascade=True, lazy=False))
+
+        threads = list(threading.Thread(target=read) for _ in range(4))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 4)
+        for neo_blocks in results:
+            self.compare_blocks(neo_blocks, self.io.nix_file.blocks)
+        self.assertIsNot(results[0][0], results[1][0])
+        self.assertEqual(len(self.io._object_map), 0)
+
+    def test_manifest_fallback_read(self):
+        objects = self.io.list_objects("spiketrain")
+        nsts = sum(1 for blk in self.io.nix_file.blocks
+                   for mtag in blk.multi_tags if mtag.type == "neo.spiketrain")
+        self.assertEqual(len(objects), nsts)
+        self.assertEqual(len(self.io._lazy_loaded), 0)
+
+    def test_readonly_no_hashing(self):
+        with mock.patch.object(NixIO, "_hash_object") as hashfunc:
+            self.io.read_all_blocks(cascade=True, lazy=False)
+            hashfunc.assert_not_called()
+        self.assertEqual(len(self.io._object_hashes), 0)
+
+    def test_proxy_read(self):
+        from neonix.io.nixio import AnalogSignalProxy, SpikeTrainProxy
+        blk = self.io.nix_file.blocks[0]
+        group = blk.groups[0]
+        segpath = "/" + blk.name + "/segments/" + group.name
+        asigname = next(da.metadata.name for da in group.data_arrays
+                        if da.type == "neo.analogsignal")
+        path = segpath + "/analogsignals/" + asigname
+        proxy = self.io.get_proxy(path)
+        self.assertIsInstance(proxy, AnalogSignalProxy)
+        self.assertEqual(proxy.shape, (100, 3))
+        full = proxy.load()
+        part = proxy[10:20, 1]
+        self.assertEqual(np.shape(part), (10, 1))
+        np.testing.assert_almost_equal(part.magnitude,
+                                       full.magnitude[10:20, [1]])
+        self.assertAlmostEqual(part.t_start.magnitude.item(),
+                               full.times[10].magnitude.item())
+
+        stname = next(mt.name for mt in group.multi_tags
+                      if mt.type == "neo.spiketrain")
+        path = segpath + "/spiketrains/" + stname
+        proxy = self.io.get_proxy(path)
+        self.assertIsInstance(proxy, SpikeTrainProxy)
+        self.assertEqual(len(proxy), 400)
+        full = proxy.load()
+        part = proxy[2:5]
+        np.testing.assert_almost_equal(part.magnitude, full.magnitude[2:5])
+        self.assertEqual(np.shape(part.waveforms), (3, 8, 5))
+        np.testing.assert_almost_equal(part.waveforms.magnitude,
+                                       full.waveforms.magnitude[2:5])
+
+        # proxy reads don't replace the objects read by the IO
+        neoblock = self.io.read_block("/" + blk.name)
+        neost = next(st for st in neoblock.segments[0].spiketrains
+                     if st.name == stname)
+        loaded = proxy.load()
+        self.assertIs(self.io._object_map[group.multi_tags[stname].id], neost)
+        self.assertIsNot(loaded, neost)
+        self.assertNotIn(path, self.io._lazy_loaded)
+
+    def test_path_cache(self):
+        blk = self.io.nix_file.blocks[0]
+        segpath = "/" + blk.name + "/segments/" + blk.groups[0].name
+        group = self.io._get_object_at(segpath)
+        self.assertIn(segpath, self.io._path_map)
+        self.assertIn("/" + blk.name, self.io._path_map)
+        with mock.patch.object(self.io, "nix_file") as nix_file:
+            self.assertIs(self.io._get_object_at(segpath), group)
+        self.assertEqual(nix_file.mock_calls, [])
+
     def test_lazy_load_subschema(self):
         blk = self.io.nix_file.blocks[0]
         segpath = "/" + blk.name + "/segments/" + blk.groups[0].name